@@ -2,33 +2,51 @@
 HTTP client for QBBN API.
 """
 
+import atexit
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+
 import httpx
 
 BASE_URL = "http://localhost:8000/api"
 
+# get_run responses kept between invocations, revalidated by ETag
+RUN_CACHE_PATH = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "world-cli" / "runs.json"
+RUN_CACHE_SIZE = 50
+
+
+@lru_cache(maxsize=None)
+def _client() -> httpx.Client:
+    """One keep-alive client per process, created on first request."""
+    client = httpx.Client(base_url=BASE_URL)
+    atexit.register(client.close)
+    return client
+
 
 # === Docs ===
 
 def create_doc(text: str) -> dict:
-    r = httpx.post(f"{BASE_URL}/docs", json={"text": text}, timeout=60)
+    r = _client().post("/docs", json={"text": text}, timeout=60)
     r.raise_for_status()
     return r.json()
 
 
 def list_docs() -> list[dict]:
-    r = httpx.get(f"{BASE_URL}/docs")
+    r = _client().get("/docs")
     r.raise_for_status()
     return r.json()["docs"]
 
 
 def get_doc(doc_id: str) -> dict:
-    r = httpx.get(f"{BASE_URL}/docs/{doc_id}")
+    r = _client().get(f"/docs/{doc_id}")
     r.raise_for_status()
     return r.json()
 
 
 def delete_doc(doc_id: str) -> dict:
-    r = httpx.delete(f"{BASE_URL}/docs/{doc_id}")
+    r = _client().delete(f"/docs/{doc_id}")
     r.raise_for_status()
     return r.json()
 
@@ -37,31 +55,45 @@ def delete_doc(doc_id: str) -> dict:
 
 def run_layer(doc_id: str, layer_id: str, force: bool = False) -> dict:
     payload = {"force": force}
-    r = httpx.post(f"{BASE_URL}/docs/{doc_id}/layers/{layer_id}/run", json=payload, timeout=120)
+    r = _client().post(f"/docs/{doc_id}/layers/{layer_id}/run", json=payload, timeout=120)
     r.raise_for_status()
     return r.json()
 
 
+def run_layers(doc_id: str, layer_ids: list[str], force: bool = False) -> list[dict]:
+    payload = {"layers": layer_ids, "force": force}
+    r = _client().post(f"/docs/{doc_id}/layers/run", json=payload, timeout=120)
+    r.raise_for_status()
+    return r.json()["results"]
+
+
 def get_layer_data(doc_id: str, layer_id: str) -> dict:
-    r = httpx.get(f"{BASE_URL}/docs/{doc_id}/layers/{layer_id}")
+    r = _client().get(f"/docs/{doc_id}/layers/{layer_id}")
     r.raise_for_status()
     return r.json()
 
 
+def get_all_layer_data(doc_id: str, layer_ids: list[str] = None) -> dict:
+    params = {"ids": ",".join(layer_ids)} if layer_ids else None
+    r = _client().get(f"/docs/{doc_id}/layers", params=params)
+    r.raise_for_status()
+    return r.json()["layers"]
+
+
 def get_layer_dsl(doc_id: str, layer_id: str) -> dict:
-    r = httpx.get(f"{BASE_URL}/docs/{doc_id}/layers/{layer_id}/dsl")
+    r = _client().get(f"/docs/{doc_id}/layers/{layer_id}/dsl")
     r.raise_for_status()
     return r.json()
 
 
 def set_layer_override(doc_id: str, layer_id: str, dsl: str) -> dict:
-    r = httpx.put(f"{BASE_URL}/docs/{doc_id}/layers/{layer_id}", json={"dsl": dsl})
+    r = _client().put(f"/docs/{doc_id}/layers/{layer_id}", json={"dsl": dsl})
     r.raise_for_status()
     return r.json()
 
 
 def clear_layer_override(doc_id: str, layer_id: str) -> dict:
-    r = httpx.delete(f"{BASE_URL}/docs/{doc_id}/layers/{layer_id}/override")
+    r = _client().delete(f"/docs/{doc_id}/layers/{layer_id}/override")
     r.raise_for_status()
     return r.json()
 
@@ -69,25 +101,25 @@ def clear_layer_override(doc_id: str, layer_id: str) -> dict:
 # === KBs ===
 
 def create_kb(name: str, dsl: str) -> dict:
-    r = httpx.post(f"{BASE_URL}/kbs", json={"name": name, "dsl": dsl}, timeout=60)
+    r = _client().post("/kbs", json={"name": name, "dsl": dsl}, timeout=60)
     r.raise_for_status()
     return r.json()
 
 
 def list_kbs() -> list[dict]:
-    r = httpx.get(f"{BASE_URL}/kbs")
+    r = _client().get("/kbs")
     r.raise_for_status()
     return r.json()["kbs"]
 
 
 def get_kb(kb_id: str) -> dict:
-    r = httpx.get(f"{BASE_URL}/kbs/{kb_id}")
+    r = _client().get(f"/kbs/{kb_id}")
     r.raise_for_status()
     return r.json()
 
 
 def get_kb_dsl(kb_id: str) -> dict:
-    r = httpx.get(f"{BASE_URL}/kbs/{kb_id}/dsl")
+    r = _client().get(f"/kbs/{kb_id}/dsl")
     r.raise_for_status()
     return r.json()
 
@@ -98,19 +130,50 @@ def create_run(doc_id: str, kb_id: str, parent_run_id: str = None) -> dict:
     payload = {"doc_id": doc_id, "kb_id": kb_id}
     if parent_run_id:
         payload["parent_run_id"] = parent_run_id
-    r = httpx.post(f"{BASE_URL}/runs", json=payload, timeout=60)
+    r = _client().post("/runs", json=payload, timeout=60)
     r.raise_for_status()
     return r.json()
 
 
+def _load_run_cache() -> dict:
+    try:
+        return json.loads(RUN_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_run_cache(cache: dict) -> None:
+    try:
+        RUN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        RUN_CACHE_PATH.write_text(json.dumps(cache))
+    except OSError:
+        pass  # caching is best-effort
+
+
 def get_run(run_id: str) -> dict:
-    r = httpx.get(f"{BASE_URL}/runs/{run_id}")
-    r.raise_for_status()
-    return r.json()
+    """Get a run, reusing the last response for it if the server says it is unchanged."""
+    cache = _load_run_cache()
+    cached = cache.get(run_id)
+    headers = {"If-None-Match": cached["etag"]} if cached else None
+    
+    r = _client().get(f"/runs/{run_id}", headers=headers)
+    if r.status_code == 304 and cached:
+        return cached["body"]
+    r.raise_for_status()
+    body = r.json()
+    
+    etag = r.headers.get("etag")
+    if etag:
+        cache.pop(run_id, None)  # re-insert as most recent
+        cache[run_id] = {"etag": etag, "body": body}
+        while len(cache) > RUN_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        _save_run_cache(cache)
+    return body
 
 
 def list_runs(doc_id: str) -> list[dict]:
-    r = httpx.get(f"{BASE_URL}/docs/{doc_id}/runs")
+    r = _client().get(f"/docs/{doc_id}/runs")
     r.raise_for_status()
     return r.json()["runs"]
 
@@ -119,18 +182,50 @@ def process_run(run_id: str, layers: list[str] = None) -> dict:
     payload = {}
     if layers:
         payload["layers"] = layers
-    r = httpx.post(f"{BASE_URL}/runs/{run_id}/process", json=payload, timeout=120)
+    r = _client().post(f"/runs/{run_id}/process", json=payload, timeout=120)
     r.raise_for_status()
     return r.json()
 
 
+def process_run_stream(run_id: str, layers: list[str] = None):
+    """
+    Yield {layer_id, success, message} for each layer as the server finishes
+    it. Raises RuntimeError if the server reports an error part way.
+    """
+    payload = {}
+    if layers:
+        payload["layers"] = layers
+    with _client().stream("POST", f"/runs/{run_id}/process/stream", json=payload, timeout=120) as r:
+        r.raise_for_status()
+        event = "message"
+        for line in r.iter_lines():
+            if line.startswith("event: "):
+                event = line[7:]
+            elif line.startswith("data: "):
+                data = json.loads(line[6:])
+                if event == "error":
+                    raise RuntimeError(data["detail"])
+                yield data
+            elif not line:
+                event = "message"
+
+
 def get_run_layer_dsl(run_id: str, layer_id: str) -> dict:
-    r = httpx.get(f"{BASE_URL}/runs/{run_id}/layers/{layer_id}/dsl")
+    r = _client().get(f"/runs/{run_id}/layers/{layer_id}/dsl")
     r.raise_for_status()
     return r.json()
 
 
+def get_run_dsls(run_id: str, layer_ids: list[str] = None) -> dict:
+    params = {"ids": ",".join(layer_ids)} if layer_ids else None
+    r = _client().get(f"/runs/{run_id}/dsl", params=params)
+    r.raise_for_status()
+    return r.json()["layers"]
+
+
+@lru_cache(maxsize=None)
 def list_layers() -> list[dict]:
-    r = httpx.get(f"{BASE_URL}/layers")
+    """The server's layer registry (fixed for the life of a server, so fetched once)."""
+    r = _client().get("/layers")
     r.raise_for_status()
     return r.json()["layers"]
\ No newline at end of file
@@ -3,7 +3,6 @@ Document commands.
 """
 
 import sys
-from rich import print_json
 from world.cli import client
 
 
@@ -69,6 +68,8 @@ def doc_show(args):
 
 def doc_json(args):
     try:
+        from rich import print_json
+        
         doc = client.get_doc(args.doc_id)
         
         # Build full document with layers
@@ -79,13 +80,10 @@ def doc_json(args):
             "layers": {}
         }
         
-        # Fetch each computed layer
-        for layer_id in doc.get("layers", []):
-            try:
-                layer_data = client.get_layer_data(args.doc_id, layer_id)
-                result["layers"][layer_id] = layer_data["data"]
-            except Exception:
-                result["layers"][layer_id] = None
+        # Fetch every computed layer in one request
+        layer_ids = doc.get("layers", [])
+        if layer_ids:
+            result["layers"] = client.get_all_layer_data(args.doc_id, layer_ids)
         
         print_json(data=result)
     except Exception as e:
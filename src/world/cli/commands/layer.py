@@ -5,7 +5,6 @@ Layer commands - via API.
 import sys
 import json
 from pathlib import Path
-from rich import print_json
 from world.cli import client
 
 
@@ -18,9 +17,9 @@ def add_subparser(subparsers):
     list_p.set_defaults(func=layer_list)
     
     # run
-    run_p = layer_sub.add_parser("run", help="Run a layer on a document")
+    run_p = layer_sub.add_parser("run", help="Run layers on a document")
     run_p.add_argument("doc_id", help="Document ID")
-    run_p.add_argument("layer_id", nargs="?", help="Layer ID (or --all)")
+    run_p.add_argument("layer_ids", nargs="*", metavar="layer_id", help="Layer IDs (or --all)")
     run_p.add_argument("--all", "-a", action="store_true", help="Run all doc-level layers")
     run_p.add_argument("--force", "-f", action="store_true", help="Force re-run")
     run_p.set_defaults(func=layer_run)
@@ -71,18 +70,18 @@ def layer_list(args):
 
 
 def layer_run(args):
-    if not args.layer_id and not args.all:
+    if not args.layer_ids and not args.all:
         print("✗ Error: specify layer_id or --all")
         sys.exit(1)
     
     if args.all:
         layers_to_run = DOC_LAYERS
     else:
-        layers_to_run = [args.layer_id]
+        layers_to_run = args.layer_ids
     
     try:
-        for layer_id in layers_to_run:
-            result = client.run_layer(args.doc_id, layer_id, force=args.force)
+        # One request for all of them; the server runs shared deps once
+        for result in client.run_layers(args.doc_id, layers_to_run, force=args.force):
             icon = "✓" if result["success"] else "✗"
             print(f"{icon} {result['layer_id']}: {result['message']}")
     except Exception as e:
@@ -103,6 +102,8 @@ def layer_show(args):
 
 def layer_json(args):
     try:
+        from rich import print_json  # imported here so other layer commands skip rich
+        
         result = client.get_layer_data(args.doc_id, args.layer_id)
         print_json(data=result["data"])
     except Exception as e:
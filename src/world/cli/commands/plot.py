@@ -2,7 +2,6 @@
 """Plot BP convergence from CSV."""
 
 import sys
-from pathlib import Path
 
 
 def add_subparser(subparsers):
@@ -22,6 +21,8 @@ def run_plot(args):
         print("  uv add pandas matplotlib")
         return
     
+    from pathlib import Path
+    
     csv_path = Path(args.csv_file)
     if not csv_path.exists():
         print(f"File not found: {csv_path}")
@@ -61,10 +61,9 @@ def run_create(args):
         # Auto-process unless --no-process
         if not args.no_process:
             print()
-            proc_result = client.process_run(run_id)
-            for lid, r in proc_result["results"].items():
+            for r in client.process_run_stream(run_id):
                 icon = "✓" if r["success"] else "✗"
-                print(f"{icon} {lid}: {r['message']}")
+                print(f"{icon} {r['layer_id']}: {r['message']}")
         
         print()
         print(f"→ {FRONTEND_URL}/runs/{run_id}")
@@ -75,12 +74,12 @@ def run_create(args):
 
 def run_process(args):
     try:
-        result = client.process_run(args.run_id, args.layers)
-        print(f"Run: {result['run_id']}")
+        print(f"Run: {args.run_id}")
         print()
-        for lid, r in result["results"].items():
+        # Print each layer as the server finishes it
+        for r in client.process_run_stream(args.run_id, args.layers):
             icon = "✓" if r["success"] else "✗"
-            print(f"{icon} {lid}: {r['message']}")
+            print(f"{icon} {r['layer_id']}: {r['message']}")
         
         print()
         print(f"→ {FRONTEND_URL}/runs/{args.run_id}")
@@ -124,25 +123,23 @@ def run_show_all(args):
         print(f"{'=' * 60}")
         print()
         
-        # Get layer order from API
-        layers_info = client.list_layers()
-        layer_order = [l['id'] for l in layers_info]
+        # Every layer's DSL in one request, in registry order (None if not run)
+        dsls = client.get_run_dsls(args.run_id)
         
-        for lid in layer_order:
-            layer_status = run["layers"].get(lid, {})
-            if layer_status.get("status") != "done":
+        for lid, result in dsls.items():
+            if result is None:
                 print(f"--- {lid} (not run) ---")
                 print()
                 continue
             
-            try:
-                result = client.get_run_layer_dsl(args.run_id, lid)
-                print(f"--- {lid}{result['ext']} ---")
-                print(result["dsl"])
-                print()
-            except:
+            if result.get("error") is not None:
                 print(f"--- {lid} (error) ---")
                 print()
+                continue
+            
+            print(f"--- {lid}{result['ext']} ---")
+            print(result["dsl"])
+            print()
                 
     except Exception as e:
         print(f"✗ Error: {e}")
@@ -1,21 +1,59 @@
 """
 QBBN CLI.
 """
-import argparse
-from world.cli.commands import doc, kb, run, layer, infer
+import importlib
+import sys
+
+
+# Subcommand -> (module defining it, help line). Only the module for the
+# command being run is imported; top-level help is printed from this table
+# without importing any of them.
+COMMANDS = {
+    "doc": ("world.cli.commands.doc", "Document management"),
+    "kb": ("world.cli.commands.kb", "Knowledge base management"),
+    "run": ("world.cli.commands.run", "Annotation runs"),
+    "layer": ("world.cli.commands.layer", "Layer management"),
+    "infer": ("world.cli.commands.infer", "Run belief propagation inference"),
+}
+
+
+def _sniff_command(argv: list[str]) -> str | None:
+    """The subcommand named on the command line, if it is a known one."""
+    if argv and argv[0] in COMMANDS:
+        return argv[0]
+    return None
+
+
+def _print_help(file=sys.stdout) -> None:
+    print(f"usage: world [-h] {{{','.join(COMMANDS)}}} ...", file=file)
+    print(file=file)
+    print("QBBN CLI", file=file)
+    print(file=file)
+    print("commands:", file=file)
+    for name, (_, help_line) in COMMANDS.items():
+        print(f"  {name:<8}{help_line}", file=file)
 
 
 def main():
+    argv = sys.argv[1:]
+    command = _sniff_command(argv)
+    
+    if command is None:
+        if argv and argv[0] not in ("-h", "--help"):
+            _print_help(file=sys.stderr)
+            print(f"world: error: unknown command '{argv[0]}'", file=sys.stderr)
+            sys.exit(2)
+        _print_help()
+        return
+    
+    # argparse (and its gettext import) only for the one command being run
+    import argparse
+    
     parser = argparse.ArgumentParser(prog="world", description="QBBN CLI")
     subparsers = parser.add_subparsers(dest="command")
+    importlib.import_module(COMMANDS[command][0]).add_subparser(subparsers)
     
-    doc.add_subparser(subparsers)
-    kb.add_subparser(subparsers)
-    run.add_subparser(subparsers)
-    layer.add_subparser(subparsers)
-    infer.add_subparser(subparsers)
-    
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if hasattr(args, "func"):
         args.func(args)
@@ -24,4 +62,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -36,7 +36,7 @@ class Mood(Enum):
     IMPERATIVE = "imperative"
 
 
-@dataclass
+@dataclass(slots=True)
 class Argument:
     role: str                           # "agent", "patient", "theme", "goal", etc.
     start: int                          # token index (inclusive)
@@ -69,7 +69,7 @@ class Argument:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SentenceAnalysis:
     # Token range this analysis covers
     start: int
@@ -111,7 +111,7 @@ class SentenceAnalysis:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TextAnalysis:
     """Analysis of a full text - sequence of sentence analyses."""
     sentences: list[SentenceAnalysis] = field(default_factory=list)
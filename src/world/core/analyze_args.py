@@ -4,10 +4,13 @@ Step 2: Find arguments and their syntactic types.
 Handles recursive sentence arguments.
 """
 
-import json
+from concurrent.futures import ThreadPoolExecutor
+
 from openai import OpenAI
 
 from world.core.analysis import SentenceAnalysis, Argument, ArgType
+from world.core.llm_cache import json_completion
+from world.core.openai_client import MAX_PARALLEL_REQUESTS
 
 
 SYSTEM_PROMPT = """You are a syntactic argument identifier.
@@ -49,6 +52,7 @@ def analyze_args(
     analysis: SentenceAnalysis,
     client: OpenAI | None = None,
     recursive: bool = True,
+    use_cache: bool | None = None,
 ) -> SentenceAnalysis:
     """
     Fill in arguments on an existing SentenceAnalysis.
@@ -58,58 +62,82 @@ def analyze_args(
         analysis: Existing analysis with verb info (indices are ABSOLUTE)
         client: OpenAI client
         recursive: Whether to recursively analyze S-type arguments
+        use_cache: Read and write the on-disk reply cache (default: see llm_cache)
     
     Returns analysis with arguments filled in (all indices ABSOLUTE).
     """
+    return _analyze_args(tokens, analysis, client, recursive, use_cache, concurrent=True)
+
+
+def _analyze_args(
+    tokens: list[str],
+    analysis: SentenceAnalysis,
+    client: OpenAI | None,
+    recursive: bool,
+    use_cache: bool | None,
+    concurrent: bool,
+) -> SentenceAnalysis:
+    """analyze_args; with concurrent, this level's sentence arguments are analyzed at once."""
     if analysis.verb_index is None:
         raise ValueError("No verb_index set, run analyze_verb first")
     
-    client = client or OpenAI()
-    
     # Convert absolute verb_index to relative for the prompt
     offset = analysis.start
     verb_index_rel = analysis.verb_index - offset
     
     prompt = build_prompt(tokens, verb_index_rel)
     
-    response = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": prompt},
-        ],
-        response_format={"type": "json_object"},
-    )
+    result = json_completion(client, "gpt-4o-mini", SYSTEM_PROMPT, prompt, use_cache=use_cache)
+    raw_args = result.get("arguments", [])
     
-    result = json.loads(response.choices[0].message.content)
+    # Recursive analysis for sentence arguments. They are independent, so the
+    # first level with several analyzes them concurrently; levels below it run
+    # inside its workers and stay sequential, so one pool bounds the requests
+    nested_at = {}  # index into raw_args -> nested analysis
+    if recursive:
+        s_indices = [i for i, a in enumerate(raw_args) if ArgType(a["arg_type"]) == ArgType.S]
+        if concurrent and len(s_indices) > 1:
+            with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as pool:
+                analyses = pool.map(lambda i: _analyze_nested(tokens, raw_args[i], offset, client, use_cache, False), s_indices)
+                nested_at = dict(zip(s_indices, analyses))
+        else:
+            nested_at = {i: _analyze_nested(tokens, raw_args[i], offset, client, use_cache, concurrent) for i in s_indices}
     
     arguments = []
-    for a in result.get("arguments", []):
+    for i, a in enumerate(raw_args):
         arg_type = ArgType(a["arg_type"])
         
         # Convert relative indices to absolute
         arg_start_abs = a["start"] + offset
         arg_end_abs = a["end"] + offset
         
-        nested = None
-        
-        # Recursive analysis for sentence arguments
-        if recursive and arg_type == ArgType.S:
-            # Get the nested tokens (use relative indices on the current tokens slice)
-            nested_tokens = tokens[a["start"]:a["end"]]
-            if nested_tokens:
-                from world.core.analyze_verb import analyze_verb
-                # Pass absolute offset for the nested analysis
-                nested = analyze_verb(nested_tokens, arg_start_abs, client)
-                nested = analyze_args(nested_tokens, nested, client, recursive=True)
-        
         arguments.append(Argument(
             role=a["role"],
             start=arg_start_abs,
             end=arg_end_abs,
             arg_type=arg_type,
-            nested=nested,
+            nested=nested_at.get(i),
         ))
     
     analysis.arguments = arguments
-    return analysis
\ No newline at end of file
+    return analysis
+
+
+def _analyze_nested(
+    tokens: list[str],
+    a: dict,
+    offset: int,
+    client: OpenAI,
+    use_cache: bool | None,
+    concurrent: bool,
+) -> SentenceAnalysis | None:
+    """Analyze a sentence argument (verb, then its own arguments)."""
+    from world.core.analyze_verb import analyze_verb
+    
+    # Get the nested tokens (use relative indices on the current tokens slice)
+    nested_tokens = tokens[a["start"]:a["end"]]
+    if not nested_tokens:
+        return None
+    # Pass absolute offset for the nested analysis
+    nested = analyze_verb(nested_tokens, a["start"] + offset, client, use_cache)
+    return _analyze_args(nested_tokens, nested, client, True, use_cache, concurrent)
@@ -3,10 +3,11 @@
 Analyze a sentence to detect if it's an implication.
 """
 
-import json
 from dataclasses import dataclass
 from openai import OpenAI
 
+from world.core.llm_cache import json_completion
+
 
 SYSTEM_PROMPT = """You are a logical structure analyzer.
 
@@ -46,7 +47,7 @@ def build_prompt(tokens: list[str]) -> str:
     return "Tokens:\n" + "\n".join(numbered)
 
 
-@dataclass
+@dataclass(slots=True)
 class ImplicationStructure:
     """Raw implication structure before full analysis."""
     antecedent_start: int
@@ -59,23 +60,14 @@ class ImplicationStructure:
 def analyze_implication(
     tokens: list[str],
     client: OpenAI | None = None,
+    use_cache: bool | None = None,
 ) -> ImplicationStructure | None:
     """
     Check if tokens form an implication. Return structure if so.
     """
-    client = client or OpenAI()
     prompt = build_prompt(tokens)
     
-    response = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": prompt},
-        ],
-        response_format={"type": "json_object"},
-    )
-    
-    result = json.loads(response.choices[0].message.content)
+    result = json_completion(client, "gpt-4o-mini", SYSTEM_PROMPT, prompt, use_cache=use_cache)
     
     if not result.get("is_implication"):
         return None
@@ -91,4 +83,4 @@ def analyze_implication(
         consequent_start=result["consequent"]["start"],
         consequent_end=result["consequent"]["end"],
         coreferences=corefs,
-    )
\ No newline at end of file
+    )
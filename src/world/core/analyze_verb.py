@@ -3,10 +3,10 @@
 Step 1: Find main verb, tense, aspect, mood.
 """
 
-import json
 from openai import OpenAI
 
 from world.core.analysis import SentenceAnalysis, Tense, Aspect, Mood
+from world.core.llm_cache import json_completion
 
 
 SYSTEM_PROMPT = """You are a syntactic analyzer.
@@ -38,6 +38,7 @@ def analyze_verb(
     tokens: list[str],
     offset: int,
     client: OpenAI | None = None,
+    use_cache: bool | None = None,
 ) -> SentenceAnalysis:
     """
     Create a SentenceAnalysis with verb info filled in.
@@ -46,22 +47,13 @@ def analyze_verb(
         tokens: The tokens for this sentence/clause
         offset: Absolute position of tokens[0] in the original text
         client: OpenAI client
+        use_cache: Read and write the on-disk reply cache (default: see llm_cache)
     
     Returns indices as ABSOLUTE positions in original text.
     """
-    client = client or OpenAI()
     prompt = build_prompt(tokens)
     
-    response = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": prompt},
-        ],
-        response_format={"type": "json_object"},
-    )
-    
-    result = json.loads(response.choices[0].message.content)
+    result = json_completion(client, "gpt-4o-mini", SYSTEM_PROMPT, prompt, use_cache=use_cache)
     
     tense = Tense(result["tense"]) if result.get("tense") else None
     aspect = Aspect(result["aspect"]) if result.get("aspect") else None
@@ -79,4 +71,4 @@ def analyze_verb(
         aspect=aspect,
         mood=mood,
         negated=result.get("negated", False),
-    )
\ No newline at end of file
+    )
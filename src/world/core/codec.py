@@ -0,0 +1,30 @@
+# src/world/core/codec.py
+"""
+JSON encoding for everything stored in Redis (records and layer data), for
+API response bodies, and for parsing LLM JSON replies.
+
+Uses orjson (C) when it is installed (the "fast" extra). Either way dumps
+returns compact UTF-8 bytes, and its output is plain JSON, so values
+written by either encoder read back with either decoder.
+"""
+
+import json
+
+# orjson is optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is None:
+    def dumps(value) -> bytes:
+        return json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+    
+    loads = json.loads
+else:
+    def dumps(value) -> bytes:
+        # Non-str keys are stringified, as json.dumps does
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    
+    loads = orjson.loads
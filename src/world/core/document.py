@@ -3,16 +3,20 @@
 Document storage and retrieval.
 """
 
-import json
 import uuid
 from dataclasses import dataclass
 from datetime import datetime
 
 import redis
 
+from world.core import codec
 from world.core.state import get_namespace
 
 
+# Keys per MGET when loading many documents
+LIST_CHUNK = 500
+
+
 def generate_id() -> str:
     return uuid.uuid4().hex[:12]
 
@@ -42,6 +46,10 @@ class DocumentStore:
     def _data_key(self, doc_id: str, stage: str) -> str:
         return f"{self.namespace}:doc:{doc_id}:data:{stage}"
     
+    def list_cache_key(self) -> str:
+        """Key of the cached listing response, dropped whenever a doc is added or deleted."""
+        return f"{self.namespace}:cache:doc_list"
+    
     def add(self, text: str) -> str:
         doc_id = generate_id()
         doc = {
@@ -50,24 +58,36 @@ class DocumentStore:
             "created_at": datetime.utcnow().isoformat(),
             "namespace": self.namespace,
         }
-        self.client.set(self._doc_key(doc_id), json.dumps(doc))
+        self.client.set(self._doc_key(doc_id), codec.dumps(doc))
         self.client.sadd(self._index_key(), doc_id)
+        self.client.delete(self.list_cache_key())
         return doc_id
     
     def get(self, doc_id: str) -> Document | None:
         data = self.client.get(self._doc_key(doc_id))
         if data is None:
             return None
-        d = json.loads(data.decode())
+        d = codec.loads(data)
         return Document(**d)
     
+    def get_with_data(self, doc_id: str, stage: str) -> tuple[Document | None, any]:
+        """A document and one stage's data with a single MGET (data is None if the doc is missing)."""
+        doc_key = self._doc_key(doc_id)
+        doc, data = self.client.mget([doc_key, f"{doc_key}:data:{stage}"])
+        if doc is None:
+            return None, None
+        return Document(**codec.loads(doc)), codec.loads(data) if data is not None else None
+    
     def list_all(self) -> list[Document]:
-        doc_ids = self.client.smembers(self._index_key())
+        doc_ids = list(self.client.smembers(self._index_key()))
+        prefix = self._doc_key("")  # resolve the namespace once
         docs = []
-        for doc_id in doc_ids:
-            doc = self.get(doc_id.decode())
-            if doc:
-                docs.append(doc)
+        # MGET in chunks: one round-trip per LIST_CHUNK docs instead of one per doc
+        for i in range(0, len(doc_ids), LIST_CHUNK):
+            keys = [prefix + doc_id.decode() for doc_id in doc_ids[i:i + LIST_CHUNK]]
+            for data in self.client.mget(keys):
+                if data is not None:
+                    docs.append(Document(**codec.loads(data)))
         return sorted(docs, key=lambda d: d.created_at, reverse=True)
     
     def search(self, query: str) -> list[Document]:
@@ -79,6 +99,7 @@ class DocumentStore:
             return False
         self.client.delete(self._doc_key(doc_id))
         self.client.srem(self._index_key(), doc_id)
+        self.client.delete(self.list_cache_key())
         # Delete all data keys
         pattern = f"{self.namespace}:doc:{doc_id}:data:*"
         for key in self.client.scan_iter(pattern):
@@ -87,13 +108,24 @@ class DocumentStore:
     
     # Data storage for processors
     def set_data(self, doc_id: str, stage: str, data: any) -> None:
-        self.client.set(self._data_key(doc_id, stage), json.dumps(data))
+        self.client.set(self._data_key(doc_id, stage), codec.dumps(data))
     
     def get_data(self, doc_id: str, stage: str) -> any:
         data = self.client.get(self._data_key(doc_id, stage))
         if data is None:
             return None
-        return json.loads(data.decode())
+        return codec.loads(data)
+    
+    def get_many(self, doc_id: str, stages: list[str]) -> dict[str, any]:
+        """Load several stages' data with a single MGET."""
+        if not stages:
+            return {}
+        prefix = self._data_key(doc_id, "")  # resolve the namespace once
+        values = self.client.mget([prefix + stage for stage in stages])
+        return {
+            stage: codec.loads(data) if data is not None else None
+            for stage, data in zip(stages, values)
+        }
     
     def has_data(self, doc_id: str, stage: str) -> bool:
         return self.client.exists(self._data_key(doc_id, stage))
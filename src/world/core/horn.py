@@ -3,21 +3,59 @@
 Horn clauses for QBBN.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from itertools import product
+from typing import Callable, Iterator
 
 from world.core.logic import (
     Type, Constant, Variable, Predicate
 )
 
 
-@dataclass
+def _compile_substitute(pred: Predicate) -> Callable[[dict], Predicate]:
+    """
+    Predicate.substitute with the variable slots found up front, for
+    predicates that are grounded many times over.
+    """
+    if not pred.variables:
+        return lambda bindings: pred
+    
+    roles = list(pred.roles)
+    slots = []  # (index, role, variable, nested substituter)
+    for i, (role, arg) in enumerate(roles):
+        if isinstance(arg, Variable):
+            slots.append((i, role, arg, None))
+        elif isinstance(arg, Predicate) and arg.variables:
+            slots.append((i, role, None, _compile_substitute(arg)))
+    name = pred.function_name
+    
+    def substitute(bindings: dict[Variable, Constant]) -> Predicate:
+        new_roles = roles.copy()
+        for i, role, var, nested in slots:
+            if nested is not None:
+                new_roles[i] = (role, nested(bindings))
+            elif var in bindings:
+                new_roles[i] = (role, bindings[var])
+        return Predicate(name, tuple(new_roles))
+    
+    return substitute
+
+
+@dataclass(slots=True)
 class HornClause:
     """A Horn clause with weight."""
     premises: tuple[Predicate, ...]
     conclusion: Predicate
     variables: tuple[Variable, ...]
     weight: float = 1.0
+    # ground()'s compiled (premises, conclusion, every variable), with the
+    # fields it was built from: (premises, conclusion, compiled)
+    _grounders: tuple | None = field(default=None, init=False, repr=False, compare=False)
+    # format_horn_clause output: (fields it was built from, {show_vars: text})
+    _formatted: tuple | None = field(default=None, init=False, repr=False, compare=False)
+    # is_grounded with the fields it was computed from: (premises, conclusion, grounded).
+    # ground() sets it on the clauses it returns
+    _grounded: tuple | None = field(default=None, init=False, repr=False, compare=False)
     
     @property
     def is_fact(self) -> bool:
@@ -25,15 +63,29 @@ class HornClause:
     
     @property
     def is_grounded(self) -> bool:
-        for p in self.premises:
-            if not p.is_grounded:
-                return False
-        return self.conclusion.is_grounded
+        cached = self._grounded
+        if cached is None or cached[0] is not self.premises or cached[1] is not self.conclusion:
+            grounded = all(p.is_grounded for p in self.premises) and self.conclusion.is_grounded
+            cached = self._grounded = (self.premises, self.conclusion, grounded)
+        return cached[2]
     
     def ground(self, bindings: dict[Variable, Constant]) -> "HornClause":
-        new_premises = tuple(p.substitute(bindings) for p in self.premises)
-        new_conclusion = self.conclusion.substitute(bindings)
-        return HornClause(new_premises, new_conclusion, (), self.weight)
+        # Rebuilt if premises or conclusion has been reassigned since
+        cached = self._grounders
+        if cached is None or cached[0] is not self.premises or cached[1] is not self.conclusion:
+            all_vars = self.conclusion.variables.union(*(p.variables for p in self.premises))
+            compiled = (
+                tuple(_compile_substitute(p) for p in self.premises),
+                _compile_substitute(self.conclusion),
+                all_vars,
+            )
+            cached = self._grounders = (self.premises, self.conclusion, compiled)
+        premises, conclusion, all_vars = cached[2]
+        new_premises = tuple(sub(bindings) for sub in premises)
+        clause = HornClause(new_premises, conclusion(bindings), (), self.weight)
+        # Grounded iff every variable was bound; no need to walk the result
+        clause._grounded = (clause.premises, clause.conclusion, all_vars.issubset(bindings))
+        return clause
     
     def to_dict(self) -> dict:
         return {
@@ -53,7 +105,7 @@ class HornClause:
         return cls(premises, conclusion, variables, weight)
 
 
-@dataclass
+@dataclass(slots=True)
 class KnowledgeBase:
     """A collection of Horn clauses and known entities."""
     entities: dict[str, Constant]
@@ -77,32 +129,59 @@ class KnowledgeBase:
         )
         self.clauses.append(clause)
     
-    def ground_all(self) -> list[HornClause]:
-        grounded = []
+    def entities_by_type(self) -> dict[str, list[Constant]]:
+        """All entities grouped by type name, in one pass."""
+        by_type = {}
+        for c in self.entities.values():
+            by_type.setdefault(c.type.name, []).append(c)
+        return by_type
+    
+    def ground_all(self) -> Iterator[HornClause]:
+        """Yield every fact and every grounding of every rule, one clause at a time."""
+        # Group entities once rather than rescanning them for every rule variable
+        by_type = self.entities_by_type()
         for clause in self.clauses:
             if clause.is_fact:
-                grounded.append(clause)
+                yield clause
             else:
-                for binding in self._all_bindings(clause.variables):
-                    grounded.append(clause.ground(binding))
-        return grounded
+                for binding in self._all_bindings(clause.variables, by_type):
+                    yield clause.ground(binding)
+    
+    def ground_all_list(self) -> list[HornClause]:
+        return list(self.ground_all())
     
-    def _all_bindings(self, variables: tuple[Variable, ...]) -> list[dict[Variable, Constant]]:
+    def _all_bindings(
+        self,
+        variables: tuple[Variable, ...],
+        by_type: dict[str, list[Constant]] | None = None,
+    ) -> Iterator[dict[Variable, Constant]]:
+        """
+        Every assignment of entities to variables. The same dict is updated
+        and yielded each time, so use it before advancing; copy it to keep it.
+        """
         if not variables:
-            return [{}]
+            yield {}
+            return
+        if by_type is None:
+            by_type = self.entities_by_type()
         
         domains = []
         for var in variables:
-            entities = self.entities_of_type(var.type.name)
+            entities = by_type.get(var.type.name)
             if not entities:
-                return []
+                return
             domains.append(entities)
         
-        bindings = []
-        for combo in product(*domains):
-            binding = {var: const for var, const in zip(variables, combo)}
-            bindings.append(binding)
-        return bindings
+        # Only the last variable changes between most consecutive bindings,
+        # so set the others once per outer combination
+        binding = dict.fromkeys(variables)
+        *outer_vars, last_var = variables
+        *outer_domains, last_domain = domains
+        for combo in product(*outer_domains):
+            binding.update(zip(outer_vars, combo))
+            for const in last_domain:
+                binding[last_var] = const
+                yield binding
     
     def to_dict(self) -> dict:
         return {
@@ -134,6 +213,19 @@ class KnowledgeBase:
 
 
 def format_horn_clause(clause: HornClause, show_vars: bool = True) -> str:
+    # Cached on the clause, and rebuilt if any of its fields has been reassigned
+    state = (clause.premises, clause.conclusion, clause.variables, clause.weight)
+    cached = clause._formatted
+    if cached is None or cached[0] != state:
+        cached = clause._formatted = (state, {})
+    
+    text = cached[1].get(show_vars)
+    if text is None:
+        text = cached[1][show_vars] = _format_horn_clause(clause, show_vars)
+    return text
+
+
+def _format_horn_clause(clause: HornClause, show_vars: bool) -> str:
     from world.core.logical_lang import format_predicate
     
     if clause.is_fact:
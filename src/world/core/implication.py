@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from world.core.logic import Predicate, Variable
 
 
-@dataclass
+@dataclass(slots=True)
 class ImplicationLink:
     """
     Ψ[variables] premise → conclusion
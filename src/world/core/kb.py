@@ -2,11 +2,13 @@
 Knowledge Base - stored with UUID, loaded from .logic DSL.
 """
 
-import json
 import uuid
 from datetime import datetime
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 
+from world.core import codec
+
 
 @dataclass
 class KBEntity:
@@ -50,6 +52,24 @@ class KnowledgeBase:
         
         return None
     
+    def get_entities(self, ids_or_aliases: Iterable[str]) -> dict[str, KBEntity]:
+        """get_entity for many names at once, keyed by the name given; misses are left out."""
+        found = {}
+        by_alias = None  # lowercased alias -> first entity with it, built on the first miss
+        for name in ids_or_aliases:
+            key = name.lower()
+            ent = self.entities.get(key)
+            if ent is None:
+                if by_alias is None:
+                    by_alias = {}
+                    for e in self.entities.values():
+                        for a in e.aliases:
+                            by_alias.setdefault(a.lower(), e)
+                ent = by_alias.get(key)
+            if ent is not None:
+                found[name] = ent
+        return found
+    
     def get_entities_by_type(self, type_name: str) -> list[KBEntity]:
         return [e for e in self.entities.values() if e.type == type_name]
     
@@ -152,6 +172,10 @@ class KBStore:
     def _kb_list_key(self) -> str:
         return "world:kbs"
     
+    def list_cache_key(self) -> str:
+        """Key of the cached listing response, dropped whenever a KB is created or deleted."""
+        return "world:cache:kb_list"
+    
     def create(self, name: str, dsl_text: str) -> str:
         """Create KB from DSL text, returns kb_id."""
         kb_id = uuid.uuid4().hex[:12]
@@ -164,8 +188,9 @@ class KBStore:
         
         _parse_dsl_into_kb(kb, dsl_text)
         
-        self.client.set(self._kb_key(kb_id), json.dumps(kb.to_dict()))
+        self.client.set(self._kb_key(kb_id), codec.dumps(kb.to_dict()))
         self.client.rpush(self._kb_list_key(), kb_id)
+        self.client.delete(self.list_cache_key())
         
         return kb_id
     
@@ -173,20 +198,19 @@ class KBStore:
         data = self.client.get(self._kb_key(kb_id))
         if not data:
             return None
-        return KnowledgeBase.from_dict(json.loads(data))
+        return KnowledgeBase.from_dict(codec.loads(data))
     
     def list_all(self) -> list[KnowledgeBase]:
         kb_ids = self.client.lrange(self._kb_list_key(), 0, -1)
-        kbs = []
-        for kid in kb_ids:
-            kb = self.get(kid.decode())
-            if kb:
-                kbs.append(kb)
-        return kbs
+        if not kb_ids:
+            return []
+        values = self.client.mget([self._kb_key(kid.decode()) for kid in kb_ids])
+        return [KnowledgeBase.from_dict(codec.loads(data)) for data in values if data]
     
     def delete(self, kb_id: str):
         self.client.delete(self._kb_key(kb_id))
         self.client.lrem(self._kb_list_key(), 0, kb_id)
+        self.client.delete(self.list_cache_key())
 
 
 def _extract_value(term) -> str:
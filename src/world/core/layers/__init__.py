@@ -10,6 +10,7 @@ Each layer:
   - Can parse/format its DSL
 """
 
+import importlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any
@@ -61,41 +62,138 @@ class Layer(ABC):
 # Layer registry
 LAYERS: dict[str, Layer] = {}
 
+# Built-in layer modules, in registration order; each registers its layer on import
+BUILTIN_LAYER_MODULES = ("base", "clauses", "args", "coref", "entities", "link", "logic", "ground")
+_builtins_loaded = False
+
+# Views of LAYERS for request handlers, rebuilt only when a layer is registered
+_LAYER_IDS: tuple[str, ...] | None = None
+_LAYER_INFO: list[dict] | None = None
+_RESOLVE_CACHE: dict[tuple[str, ...], tuple[str, ...]] = {}
+_LEVELS_CACHE: dict[tuple[str, ...], tuple[tuple[str, ...], ...]] = {}
+
 
 def register_layer(layer: Layer) -> Layer:
     """Register a layer instance."""
+    global _LAYER_IDS, _LAYER_INFO
     LAYERS[layer.id] = layer
+    _LAYER_IDS = None
+    _LAYER_INFO = None
+    _RESOLVE_CACHE.clear()
+    _LEVELS_CACHE.clear()
     return layer
 
 
+def register_all_layers() -> None:
+    """Import the built-in layer modules, once. The registry calls this on first use."""
+    global _builtins_loaded
+    if _builtins_loaded:
+        return
+    for name in BUILTIN_LAYER_MODULES:
+        importlib.import_module(f"{__name__}.{name}")
+    _builtins_loaded = True
+
+
 def get_layer(layer_id: str) -> Layer:
-    if layer_id not in LAYERS:
+    layer = LAYERS.get(layer_id)
+    if layer is None and not _builtins_loaded:
+        register_all_layers()
+        layer = LAYERS.get(layer_id)
+    if layer is None:
         available = ", ".join(LAYERS.keys())
         raise ValueError(f"Unknown layer: {layer_id}. Available: {available}")
-    return LAYERS[layer_id]
+    return layer
 
 
 def list_layers() -> list[str]:
+    register_all_layers()
     return list(LAYERS.keys())
 
 
+def layer_ids() -> tuple[str, ...]:
+    """Registered layer ids, shared between callers (use list_layers for a copy)."""
+    global _LAYER_IDS
+    register_all_layers()
+    if _LAYER_IDS is None:
+        _LAYER_IDS = tuple(LAYERS)
+    return _LAYER_IDS
+
+
+def layer_info() -> list[dict]:
+    """id, ext and depends_on for every registered layer."""
+    global _LAYER_INFO
+    register_all_layers()
+    if _LAYER_INFO is None:
+        _LAYER_INFO = [
+            {"id": lid, "ext": layer.ext, "depends_on": layer.depends_on}
+            for lid, layer in LAYERS.items()
+        ]
+    return _LAYER_INFO
+
+
 def resolve_dependencies(layer_ids: list[str]) -> list[str]:
     """
     Topological sort: return all layers needed, in execution order.
+    
+    Memoized per requested id list until the next register_layer.
     """
+    key = tuple(layer_ids)
+    order = _RESOLVE_CACHE.get(key)
+    if order is not None:
+        return list(order)
+    
     needed = set()
     order = []
     
-    def visit(lid: str):
-        if lid in needed:
-            return
-        layer = get_layer(lid)
-        for dep in layer.depends_on:
-            visit(dep)
-        needed.add(lid)
-        order.append(lid)
+    # Post-order DFS with an explicit stack of (layer, its remaining deps)
+    for root in layer_ids:
+        if root in needed:
+            continue
+        stack = [(root, iter(get_layer(root).depends_on))]
+        visiting = {root}
+        while stack:
+            lid, deps = stack[-1]
+            for dep in deps:
+                if dep in needed:
+                    continue
+                if dep in visiting:
+                    raise ValueError(f"Dependency cycle through layer: {dep}")
+                visiting.add(dep)
+                stack.append((dep, iter(get_layer(dep).depends_on)))
+                break
+            else:
+                stack.pop()
+                visiting.discard(lid)
+                needed.add(lid)
+                order.append(lid)
+    
+    if len(_RESOLVE_CACHE) >= 256:  # requests pick arbitrary id lists; stay bounded
+        _RESOLVE_CACHE.clear()
+    _RESOLVE_CACHE[key] = tuple(order)
+    return order
+
+
+def dependency_levels(layer_ids: list[str]) -> tuple[tuple[str, ...], ...]:
+    """
+    resolve_dependencies grouped into levels: every layer's dependencies are
+    in earlier levels, so the layers within one level can run concurrently.
+    
+    Memoized per requested id list until the next register_layer.
+    """
+    key = tuple(layer_ids)
+    levels = _LEVELS_CACHE.get(key)
+    if levels is not None:
+        return levels
+    
+    depth = {}
+    for lid in resolve_dependencies(layer_ids):
+        depth[lid] = 1 + max((depth[dep] for dep in get_layer(lid).depends_on), default=-1)
     
-    for lid in layer_ids:
-        visit(lid)
+    grouped = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+    for lid, d in depth.items():
+        grouped[d].append(lid)
     
-    return order
\ No newline at end of file
+    if len(_LEVELS_CACHE) >= 256:  # requests pick arbitrary id lists; stay bounded
+        _LEVELS_CACHE.clear()
+    levels = _LEVELS_CACHE[key] = tuple(tuple(level) for level in grouped)
+    return levels
@@ -2,8 +2,14 @@
 Arguments layer - identify verb arguments per clause per sentence.
 """
 
-import json
+import re
+
 from world.core.layers import Layer, LayerResult, register_layer
+from world.core.openai_client import json_completions, MAX_PARALLEL_REQUESTS
+
+
+_CLAUSE_LINE_RE = re.compile(r"clause\s+\[(\d+):(\d+)\]\s*(\w*)\s*verb=(\d+)")
+_ARG_LINE_RE = re.compile(r"(\w+)\s+\[(\d+):(\d+)\]")
 
 
 ARG_PROMPT = """Identify arguments of the verb.
@@ -43,51 +49,51 @@ class ArgsLayer(Layer):
         if not openai:
             return LayerResult(False, None, "no openai client")
         
-        # Build lookup
-        sent_tokens = {s["idx"]: [t["text"] for t in s["tokens"]] for s in sentences}
+        # Token texts are only needed for sentences that have clauses
+        sent_by_idx = {s["idx"]: s for s in sentences}
         
+        # Build every clause's prompt first, then request them all at once
         result_sentences = []
-        total_args = 0
+        jobs = []  # (index into result_sentences, clause), one per prompt
+        prompts = []
         
         for clause_sent in clause_sentences:
             sent_idx = clause_sent["sentence_idx"]
-            tokens = sent_tokens.get(sent_idx, [])
+            sent = sent_by_idx.get(sent_idx)
+            tokens = [t["text"] for t in sent["tokens"]] if sent else []
             
-            clause_results = []
+            result_sentences.append({
+                "sentence_idx": sent_idx,
+                "clauses": [],
+            })
             
             for clause in clause_sent.get("clauses", []):
-                clause_tokens = tokens[clause["start"]:clause["end"]]
-                verb_rel = clause["verb_index"] - clause["start"]
+                start = clause["start"]
+                clause_tokens = tokens[start:clause["end"]]
+                verb_rel = clause["verb_index"] - start
                 
-                prompt = "Clause tokens:\n" + "\n".join(f"{i}: {t}" for i, t in enumerate(clause_tokens))
+                prompt = "Clause tokens:\n" + "\n".join([f"{i}: {t}" for i, t in enumerate(clause_tokens)])
                 prompt += f"\n\nVerb: {clause_tokens[verb_rel]} (index {verb_rel})"
                 prompt += f"\nTotal: {len(clause_tokens)} tokens"
                 
-                response = openai.chat.completions.create(
-                    model="gpt-4o-mini",
-                    messages=[
-                        {"role": "system", "content": ARG_PROMPT},
-                        {"role": "user", "content": prompt},
-                    ],
-                    response_format={"type": "json_object"},
-                )
-                
-                args = json.loads(response.choices[0].message.content)
-                
-                clause_results.append({
-                    "clause_start": clause["start"],
-                    "clause_end": clause["end"],
-                    "clause_label": clause.get("label", ""),
-                    "verb_index": clause["verb_index"],
-                    "arguments": args.get("arguments", []),
-                })
-                
-                total_args += len(args.get("arguments", []))
-            
-            result_sentences.append({
-                "sentence_idx": sent_idx,
-                "clauses": clause_results,
+                jobs.append((len(result_sentences) - 1, clause))
+                prompts.append(prompt)
+        
+        concurrency = context.get("openai_concurrency", MAX_PARALLEL_REQUESTS)
+        replies = json_completions(openai, ARG_PROMPT, prompts, concurrency=concurrency) if prompts else []
+        
+        total_args = 0
+        for (pos, clause), args in zip(jobs, replies):
+            arguments = args.get("arguments", [])
+            result_sentences[pos]["clauses"].append({
+                "clause_start": clause["start"],
+                "clause_end": clause["end"],
+                "clause_label": clause.get("label", ""),
+                "verb_index": clause["verb_index"],
+                "arguments": arguments,
             })
+            
+            total_args += len(arguments)
         
         return LayerResult(True, {"sentences": result_sentences}, f"{total_args} arguments")
     
@@ -99,7 +105,6 @@ class ArgsLayer(Layer):
           agent [0:1]
           theme [2:4]
         """
-        import re
         sentences = []
         current_sent = None
         current_clause = None
@@ -121,7 +126,7 @@ class ArgsLayer(Layer):
             elif line.startswith("clause"):
                 if current_clause is not None and current_sent is not None:
                     current_sent["clauses"].append(current_clause)
-                match = re.match(r"clause\s+\[(\d+):(\d+)\]\s*(\w*)\s*verb=(\d+)", line)
+                match = _CLAUSE_LINE_RE.match(line)
                 if match:
                     start, end, label, verb = match.groups()
                     current_clause = {
@@ -132,7 +137,7 @@ class ArgsLayer(Layer):
                         "arguments": [],
                     }
             elif orig_line.startswith("  ") and current_clause is not None:
-                match = re.match(r"(\w+)\s+\[(\d+):(\d+)\]", line)
+                match = _ARG_LINE_RE.match(line)
                 if match:
                     role, start, end = match.groups()
                     current_clause["arguments"].append({
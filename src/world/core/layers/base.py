@@ -7,9 +7,9 @@ Output is immutable foundation for all other layers.
 Every token is addressable as (sentence_idx, token_idx).
 """
 
-import json
+from world.core import codec
 from world.core.layers import Layer, LayerResult, register_layer
-from world.core.tokenize import tokenize, Token, SpellCorrector
+from world.core.tokenize import tokenize, Token, SpellCorrector, default_known_words
 
 
 SEGMENT_PROMPT = """You are a sentence segmenter.
@@ -52,7 +52,9 @@ class BaseLayer(Layer):
         raw_tokens = tokenize(doc.text)
         
         # Step 2: Spell correct
-        corrector = SpellCorrector(openai)
+        # A shared batcher (see LayerRunner.spell_batcher) lets docs processed
+        # at the same time share LLM calls
+        corrector = context.get("spell_batcher") or SpellCorrector(openai, known_words=default_known_words())
         corrected = corrector.correct(raw_tokens)
         
         # Build flat token list
@@ -68,7 +70,7 @@ class BaseLayer(Layer):
         # Step 3: Segment into sentences
         token_texts = [t["text"] for t in flat_tokens]
         
-        prompt = "Tokens:\n" + "\n".join(f"{i}: {t}" for i, t in enumerate(token_texts))
+        prompt = "Tokens:\n" + "\n".join([f"{i}: {t}" for i, t in enumerate(token_texts)])
         prompt += f"\n\nTotal: {len(token_texts)} tokens (indices 0 to {len(token_texts)-1})"
         
         response = openai.chat.completions.create(
@@ -80,7 +82,7 @@ class BaseLayer(Layer):
             response_format={"type": "json_object"},
         )
         
-        seg_data = json.loads(response.choices[0].message.content)
+        seg_data = codec.loads(response.choices[0].message.content)
         sentence_bounds = seg_data.get("sentences", [])
         
         # Safety: if empty or incomplete
@@ -2,8 +2,13 @@
 Clauses layer - identify clause boundaries per sentence.
 """
 
-import json
+import re
+
 from world.core.layers import Layer, LayerResult, register_layer
+from world.core.openai_client import json_completions, MAX_PARALLEL_REQUESTS
+
+
+_CLAUSE_LINE_RE = re.compile(r"\[(\d+):(\d+)\]\s*(\w*)\s*verb=(\d+)")
 
 
 CLAUSE_PROMPT = """Identify all clauses in this sentence.
@@ -40,26 +45,22 @@ class ClausesLayer(Layer):
         if not openai:
             return LayerResult(False, None, "no openai client")
         
-        result_sentences = []
-        total_clauses = 0
-        
+        # One prompt per sentence, requested all at once
+        prompts = []
         for sent in sentences:
             tokens = [t["text"] for t in sent["tokens"]]
             
-            prompt = "Tokens:\n" + "\n".join(f"{i}: {t}" for i, t in enumerate(tokens))
+            prompt = "Tokens:\n" + "\n".join([f"{i}: {t}" for i, t in enumerate(tokens)])
             prompt += f"\n\nTotal: {len(tokens)} tokens"
-            
-            response = openai.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": CLAUSE_PROMPT},
-                    {"role": "user", "content": prompt},
-                ],
-                response_format={"type": "json_object"},
-            )
-            
-            clause_data = json.loads(response.choices[0].message.content)
-            
+            prompts.append(prompt)
+        
+        concurrency = context.get("openai_concurrency", MAX_PARALLEL_REQUESTS)
+        replies = json_completions(openai, CLAUSE_PROMPT, prompts, concurrency=concurrency) if prompts else []
+        
+        result_sentences = []
+        total_clauses = 0
+        
+        for sent, clause_data in zip(sentences, replies):
             result_sentences.append({
                 "sentence_idx": sent["idx"],
                 "clauses": clause_data.get("clauses", []),
@@ -78,7 +79,6 @@ class ClausesLayer(Layer):
         [6:9] consequent verb=7
         skip: 0 5
         """
-        import re
         sentences = []
         current = None
         
@@ -97,7 +97,7 @@ class ClausesLayer(Layer):
                     _, rest = line.split(":", 1)
                     current["skip_tokens"] = [int(x) for x in rest.strip().split()]
                 elif line.startswith("["):
-                    match = re.match(r"\[(\d+):(\d+)\]\s*(\w*)\s*verb=(\d+)", line)
+                    match = _CLAUSE_LINE_RE.match(line)
                     if match:
                         start, end, label, verb = match.groups()
                         current["clauses"].append({
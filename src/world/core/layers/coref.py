@@ -2,10 +2,15 @@
 Coreference layer - link coreferent mentions across sentences.
 """
 
-import json
+import re
+
+from world.core import codec
 from world.core.layers import Layer, LayerResult, register_layer
 
 
+_PAIR_RE = re.compile(r"\((\d+),\s*(\d+)\)\s*=\s*\((\d+),\s*(\d+)\)")
+
+
 COREF_PROMPT = """Identify coreference links in these sentences.
 
 Coreference: two mentions that refer to the same entity.
@@ -57,7 +62,7 @@ class CorefLayer(Layer):
             response_format={"type": "json_object"},
         )
         
-        data = json.loads(response.choices[0].message.content)
+        data = codec.loads(response.choices[0].message.content)
         n_corefs = len(data.get("coreferences", []))
         
         return LayerResult(True, data, f"{n_corefs} coreferences")
@@ -68,7 +73,6 @@ class CorefLayer(Layer):
         (0, 1) = (0, 6)
         (0, 3) = (1, 0)
         """
-        import re
         coreferences = []
         
         for line in text.strip().split("\n"):
@@ -76,7 +80,7 @@ class CorefLayer(Layer):
             if not line or line.startswith("#"):
                 continue
             
-            match = re.match(r"\((\d+),\s*(\d+)\)\s*=\s*\((\d+),\s*(\d+)\)", line)
+            match = _PAIR_RE.match(line)
             if match:
                 s1, t1, s2, t2 = match.groups()
                 coreferences.append({
@@ -2,10 +2,17 @@
 Entities layer - identify named entities, types, and quantifiers.
 """
 
-import json
+import re
+
+from world.core import codec
 from world.core.layers import Layer, LayerResult, register_layer
 
 
+_ENTITY_RE = re.compile(r"(\w+)\s*:\s*(\w+)\s*@\s*\((\d+),\s*(\d+)\)")
+_TYPE_RE = re.compile(r"(\w+)\s*@\s*\((\d+),\s*(\d+)\)")
+_QUANTIFIER_RE = re.compile(r"(\w+)\s*[→\->]+\s*(\w+)\s*@\s*\((\d+),\s*(\d+)\)")
+
+
 ENTITIES_PROMPT = """Identify entities, types, and quantifiers in these sentences.
 
 ENTITIES: Named/specific things (proper nouns, definite references)
@@ -71,7 +78,7 @@ class EntitiesLayer(Layer):
             response_format={"type": "json_object"},
         )
         
-        data = json.loads(response.choices[0].message.content)
+        data = codec.loads(response.choices[0].message.content)
         
         n_ent = len(data.get("entities", []))
         n_types = len(data.get("types", []))
@@ -92,8 +99,6 @@ class EntitiesLayer(Layer):
         # quantifiers
         someone → x0 @ (0, 1)
         """
-        import re
-        
         entities = []
         types = []
         quantifiers = []
@@ -113,7 +118,7 @@ class EntitiesLayer(Layer):
                 section = "quantifiers"
             elif section == "entities":
                 # socrates : person @ (0, 0)
-                match = re.match(r"(\w+)\s*:\s*(\w+)\s*@\s*\((\d+),\s*(\d+)\)", line)
+                match = _ENTITY_RE.match(line)
                 if match:
                     id_, type_, s, t = match.groups()
                     entities.append({
@@ -123,7 +128,7 @@ class EntitiesLayer(Layer):
                     })
             elif section == "types":
                 # man @ (0, 4)
-                match = re.match(r"(\w+)\s*@\s*\((\d+),\s*(\d+)\)", line)
+                match = _TYPE_RE.match(line)
                 if match:
                     id_, s, t = match.groups()
                     types.append({
@@ -132,7 +137,7 @@ class EntitiesLayer(Layer):
                     })
             elif section == "quantifiers":
                 # someone → x0 @ (0, 1)
-                match = re.match(r"(\w+)\s*[→->]+\s*(\w+)\s*@\s*\((\d+),\s*(\d+)\)", line)
+                match = _QUANTIFIER_RE.match(line)
                 if match:
                     token, var, s, t = match.groups()
                     quantifiers.append({
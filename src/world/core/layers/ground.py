@@ -78,7 +78,7 @@ class GroundLayer(Layer):
             
             doc = parse_logical(combined_text)
             horn_kb = HornKB.from_logical_document(doc)
-            grounded = horn_kb.ground_all()
+            grounded = horn_kb.ground_all_list()
             
             lines = []
             for clause in grounded:
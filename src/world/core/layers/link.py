@@ -2,9 +2,15 @@
 Link layer - connects discourse entities to knowledge base entities.
 """
 
+import re
+
 from world.core.layers import Layer, LayerResult, register_layer
 
 
+_LINK_RE = re.compile(r"(\w+)\s*[→\->]+\s*kb:(\w+)\s*@\s*\((\d+),\s*(\d+)\)")
+_UNLINKED_RE = re.compile(r"(\w+)\s*:\s*(\w+)\s*@\s*\((\d+),\s*(\d+)\)")
+
+
 class LinkLayer(Layer):
     id = "link"
     depends_on = ["entities"]
@@ -23,10 +29,13 @@ class LinkLayer(Layer):
         links = []
         unlinked = []
         
+        # Resolve every id in one pass, so alias lookups share one index
+        found = kb.get_entities(ent["id"] for ent in discourse_entities)
+        
         for ent in discourse_entities:
             ent_id = ent["id"]
             
-            kb_entity = kb.get_entity(ent_id)
+            kb_entity = found.get(ent_id)
             
             if kb_entity:
                 links.append({
@@ -58,7 +67,6 @@ class LinkLayer(Layer):
         return LayerResult(True, data, f"{len(links)} linked, {len(unlinked)} new")
     
     def parse_dsl(self, text: str) -> dict:
-        import re
         links = []
         unlinked = []
         
@@ -74,7 +82,7 @@ class LinkLayer(Layer):
             elif line == "# unlinked":
                 section = "unlinked"
             elif section == "linked":
-                match = re.match(r"(\w+)\s*[→->]+\s*kb:(\w+)\s*@\s*\((\d+),\s*(\d+)\)", line)
+                match = _LINK_RE.match(line)
                 if match:
                     disc_id, kb_id, s, t = match.groups()
                     links.append({
@@ -84,7 +92,7 @@ class LinkLayer(Layer):
                         "status": "linked",
                     })
             elif section == "unlinked":
-                match = re.match(r"(\w+)\s*:\s*(\w+)\s*@\s*\((\d+),\s*(\d+)\)", line)
+                match = _UNLINKED_RE.match(line)
                 if match:
                     disc_id, disc_type, s, t = match.groups()
                     unlinked.append({
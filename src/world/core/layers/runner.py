@@ -7,7 +7,30 @@ Two modes:
 - LayerRunner: for run-level layers that need a KB (ground, logic)
 """
 
-from world.core.layers import get_layer, resolve_dependencies, LayerResult
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from world.core.layers import get_layer, dependency_levels, LayerResult
+from world.core.tokenize import SpellBatcher, SpellCorrector, default_known_words
+
+
+# Most layers run at once within one dependency level (they mostly wait on the LLM)
+MAX_PARALLEL_LAYERS = 8
+
+
+def _iter_levels(levels: list[list[str]], run_one):
+    """
+    Yield (layer_id, result) as layers finish. Each level's layers run
+    concurrently; a level starts once the one before it is done.
+    """
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_LAYERS) as pool:
+        for level in levels:
+            if len(level) == 1:
+                yield level[0], run_one(level[0])
+                continue
+            futures = {pool.submit(run_one, lid): lid for lid in level}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
 
 
 def run_layer_on_doc(doc_store, doc, layer_id: str, force: bool = False, context: dict = None) -> LayerResult:
@@ -17,49 +40,60 @@ def run_layer_on_doc(doc_store, doc, layer_id: str, force: bool = False, context
     For doc-level layers that don't need a KB.
     Data is stored in doc_store.
     """
+    return run_layers_on_doc(doc_store, doc, [layer_id], force=force, context=context)[layer_id]
+
+
+def run_layers_on_doc(doc_store, doc, layer_ids: list[str], force: bool = False, context: dict = None) -> dict[str, LayerResult]:
+    """
+    Run several layers (and their dependencies) on a document in one pass,
+    so shared dependencies are run or loaded once. Returns the requested
+    layers' results.
+    """
     from world.server.deps import get_openai
     
     if context is None:
         context = {"openai": get_openai()}
     
-    all_layers = resolve_dependencies([layer_id])
+    levels = dependency_levels(layer_ids)
     
-    for lid in all_layers:
+    # One round-trip for every stage this call may read; stages written
+    # below are re-read from the store only if a later layer needs them
+    stored = doc_store.get_many(doc.id, [lid for level in levels for lid in level])
+    
+    def run_one(lid: str) -> LayerResult:
         layer = get_layer(lid)
         
         # Check cache
-        if not force and doc_store.has_data(doc.id, lid):
-            if lid == layer_id:
-                data = doc_store.get_data(doc.id, lid)
-                return LayerResult(True, data, "cached")
-            continue
+        if not force and stored[lid] is not None:
+            return LayerResult(True, stored[lid], "cached")
         
         # Gather inputs from dependencies
         inputs = {"_doc": doc}
         missing = []
         for dep in layer.depends_on:
-            if doc_store.has_data(doc.id, dep):
-                inputs[dep] = doc_store.get_data(doc.id, dep)
+            data = stored[dep]
+            if data is None:
+                data = stored[dep] = doc_store.get_data(doc.id, dep)
+            if data is not None:
+                inputs[dep] = data
             else:
                 missing.append(dep)
         
         if missing:
-            if lid == layer_id:
-                return LayerResult(False, None, f"missing deps: {missing}")
-            continue
+            return LayerResult(False, None, f"missing deps: {missing}")
         
         # Run layer
         try:
             result = layer.process(inputs, context)
             if result.success:
                 doc_store.set_data(doc.id, lid, result.data)
-            if lid == layer_id:
-                return result
+                stored[lid] = None
+            return result
         except Exception as e:
-            if lid == layer_id:
-                return LayerResult(False, None, f"error: {e}")
+            return LayerResult(False, None, f"error: {e}")
     
-    return LayerResult(False, None, "layer not found")
+    results = dict(_iter_levels(levels, run_one))
+    return {lid: results[lid] for lid in layer_ids}
 
 
 class LayerRunner:
@@ -70,56 +104,95 @@ class LayerRunner:
         self.run_store = run_store
         self.kb_store = kb_store
         self.context = context or {}
+        self._spell_batcher = None
+        self._spell_lock = threading.Lock()
+    
+    @property
+    def spell_batcher(self) -> SpellBatcher:
+        """
+        Spell correction shared by every doc this runner's owner processes,
+        so concurrent base-layer runs batch their LLM calls. Lives as long as
+        the runner; built on first use.
+        """
+        with self._spell_lock:
+            if self._spell_batcher is None:
+                from world.server.deps import get_openai
+                openai = self.context.get("openai") or get_openai()
+                self._spell_batcher = SpellBatcher(SpellCorrector(openai, known_words=default_known_words()))
+            return self._spell_batcher
     
     def run(self, run_id: str, layer_ids: list[str], force: bool = False) -> dict[str, LayerResult]:
-        """Run specified layers on a run workspace."""
+        """
+        Run specified layers on a run workspace. Layers whose dependencies
+        are all met run concurrently.
+        """
+        return dict(self.run_iter(run_id, layer_ids, force=force))
+    
+    def run_iter(self, run_id: str, layer_ids: list[str], force: bool = False):
+        """Like run, but yields (layer_id, result) as each layer finishes."""
+        from world.server.deps import get_openai
+        
         run = self.run_store.get(run_id)
         if not run:
-            return {"_error": LayerResult(False, None, "run not found")}
+            yield "_error", LayerResult(False, None, "run not found")
+            return
+        
+        # Per-run copy of the context, so one runner can serve many runs at once
+        context = dict(self.context)
+        if "openai" not in context:
+            context["openai"] = get_openai()
+        if "spell_batcher" not in context:
+            context["spell_batcher"] = self.spell_batcher
         
         # Load KB and add to context
         if self.kb_store:
             kb = self.kb_store.get(run.kb_id)
             if kb:
-                self.context["kb"] = kb
+                context["kb"] = kb
         
-        all_layers = resolve_dependencies(layer_ids)
+        levels = dependency_levels(layer_ids)
         
-        results = {}
+        # One MGET for every layer this run may read; layers written below
+        # are re-read from the store only if a later layer needs them
+        stored = self.run_store.get_many(run_id, [lid for level in levels for lid in level])
         
-        for lid in all_layers:
+        doc = None
+        if force or None in stored.values():
+            doc = self.doc_store.get(run.doc_id)
+        
+        def run_one(lid: str) -> LayerResult:
             layer = get_layer(lid)
             
-            if not force and self.run_store.has_data(run_id, lid):
-                data = self.run_store.get_data(run_id, lid)
-                results[lid] = LayerResult(True, data, "cached")
-                continue
+            if not force and stored[lid] is not None:
+                return LayerResult(True, stored[lid], "cached")
             
             inputs = {}
             missing = []
             for dep in layer.depends_on:
-                if self.run_store.has_data(run_id, dep):
-                    inputs[dep] = self.run_store.get_data(run_id, dep)
+                data = stored[dep]
+                if data is None:
+                    data = stored[dep] = self.run_store.get_data(run_id, dep)
+                if data is not None:
+                    inputs[dep] = data
                 else:
                     missing.append(dep)
             
             if missing:
-                results[lid] = LayerResult(False, None, f"missing deps: {missing}")
-                continue
+                return LayerResult(False, None, f"missing deps: {missing}")
             
-            doc = self.doc_store.get(run.doc_id)
             if doc:
                 inputs["_doc"] = doc
             
             try:
-                result = layer.process(inputs, self.context)
+                result = layer.process(inputs, context)
                 if result.success:
                     self.run_store.set_data(run_id, lid, result.data)
-                results[lid] = result
+                    stored[lid] = None
+                return result
             except Exception as e:
-                results[lid] = LayerResult(False, None, f"error: {e}")
+                return LayerResult(False, None, f"error: {e}")
         
-        return results
+        yield from _iter_levels(levels, run_one)
     
     def get_dsl(self, run_id: str, layer_id: str) -> str | None:
         """Get layer data formatted as DSL."""
@@ -128,3 +201,21 @@ class LayerRunner:
         if data is None:
             return None
         return layer.format_dsl(data)
+    
+    def get_dsl_many(self, run_id: str, layer_ids: list[str]) -> dict[str, str | Exception | None]:
+        """
+        get_dsl for several layers, reading their data in one round-trip. A
+        layer whose data fails to format maps to the exception raised, so
+        one bad layer does not fail the rest.
+        """
+        data = self.run_store.get_many(run_id, layer_ids)
+        dsls = {}
+        for lid, d in data.items():
+            if d is None:
+                dsls[lid] = None
+                continue
+            try:
+                dsls[lid] = get_layer(lid).format_dsl(d)
+            except Exception as e:
+                dsls[lid] = e
+        return dsls
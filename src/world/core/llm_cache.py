@@ -0,0 +1,103 @@
+# src/world/core/llm_cache.py
+"""
+On-disk cache of JSON-mode chat completions.
+
+Replies are stored under $XDG_CACHE_HOME/world/llm (default ~/.cache),
+one file per request, keyed by a hash of PROMPT_VERSION, the model and
+both prompts. The cache is off unless WORLD_LLM_CACHE=1 is set or a
+caller passes use_cache=True. Delete the directory to clear it.
+"""
+
+import hashlib
+import os
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+from openai import OpenAI
+
+from world.core import codec
+from world.core.openai_client import shared_openai, system_message
+
+
+LLM_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "world" / "llm"
+
+# Whether use_cache=None (the analyzers' default) reads and writes the cache
+LLM_CACHE_ENABLED = os.environ.get("WORLD_LLM_CACHE", "") == "1"
+
+# Part of every key. Bump it when an analyzer SYSTEM_PROMPT or the way its
+# replies are interpreted changes, so older cached replies are not reused.
+PROMPT_VERSION = 1
+
+
+@lru_cache(maxsize=None)
+def _prefix_hash(model: str, system_prompt: str):
+    """Hash state after the model and system prompt, which each caller reuses."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in (str(PROMPT_VERSION), model, system_prompt):
+        h.update(part.encode())
+        h.update(b"\0")
+    return h
+
+
+def cache_key(model: str, system_prompt: str, prompt: str) -> str:
+    h = _prefix_hash(model, system_prompt).copy()
+    h.update(prompt.encode())
+    h.update(b"\0")
+    return h.hexdigest()
+
+
+def _read(key: str) -> dict | None:
+    try:
+        return codec.loads((LLM_CACHE_DIR / f"{key}.json").read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _write(key: str, content: str) -> None:
+    path = LLM_CACHE_DIR / f"{key}.json"
+    # Write then rename, so a concurrent reader never sees a partial file
+    tmp = path.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(content)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # caching is best-effort
+
+
+def json_completion(
+    client: OpenAI | None,
+    model: str,
+    system_prompt: str,
+    prompt: str,
+    use_cache: bool | None = None,
+) -> dict:
+    """
+    Parsed reply to a JSON-mode chat completion. With use_cache (default
+    LLM_CACHE_ENABLED), an identical earlier request is answered from disk
+    and new replies are stored. With no client, the shared one is used,
+    and only created if a request is made.
+    """
+    if use_cache is None:
+        use_cache = LLM_CACHE_ENABLED
+    if use_cache:
+        key = cache_key(model, system_prompt, prompt)
+        cached = _read(key)
+        if cached is not None:
+            return cached
+    
+    client = client or shared_openai()
+    response = client.chat.completions.create(
+        model=model,
+        messages=[
+            system_message(system_prompt),
+            {"role": "user", "content": prompt},
+        ],
+        response_format={"type": "json_object"},
+    )
+    content = response.choices[0].message.content
+    result = codec.loads(content)
+    if use_cache:
+        _write(key, content)
+    return result
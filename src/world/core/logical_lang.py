@@ -10,6 +10,7 @@ Syntax:
 """
 
 import re
+import sys
 from dataclasses import dataclass, field
 
 from world.core.logic import (
@@ -17,7 +18,30 @@ from world.core.logic import (
 )
 
 
-@dataclass
+_ENTITY_RE = re.compile(r"entity\s+(\w+)\s*:\s*(\w+)")
+_PREDICATE_RE = re.compile(r"(\w+)\s*\((.*)\)")
+_NAME_PAIR_RE = re.compile(r"(\w+)\s*:\s*(\w+)")  # role: arg, var: type
+_WEIGHT_RE = re.compile(r"\[(\d+\.?\d*)\]\s*$")
+_RULE_RE = re.compile(r"rule\s*\[(.*?)\]\s*:\s*(.+)")
+_RULE_BODY_RE = re.compile(r"(.*?)\s*->\s*(.+)")
+_COMMA_SPLIT = re.compile(r"\s*,\s*")
+_AND_SPLIT = re.compile(r"\s*&\s*")
+
+# Tabs become spaces and CRs are dropped
+WS_TABLE = str.maketrans({"\t": " ", "\r": None})
+
+
+def iter_lines(text: str):
+    """Yield the lines of text one at a time, without building a list of them."""
+    find = text.find
+    start = 0
+    while (end := find("\n", start)) >= 0:
+        yield text[start:end]
+        start = end + 1
+    yield text[start:]
+
+
+@dataclass(slots=True)
 class Rule:
     """A rule with potentially multiple premises and a weight."""
     premises: list[Predicate]
@@ -26,7 +50,7 @@ class Rule:
     weight: float = 1.0  # default weight
 
 
-@dataclass
+@dataclass(slots=True)
 class LogicalDocument:
     """Parsed logical document."""
     entities: dict[str, Constant] = field(default_factory=dict)
@@ -46,24 +70,30 @@ class ParseError(Exception):
 class LogicalParser:
     def __init__(self):
         self.doc = LogicalDocument()
+        # Interned roles/predicates: a KB reuses a handful of names, so equal
+        # objects are shared rather than rebuilt on every parse_predicate call.
+        self._role_cache: dict[str, RoleLabel] = {}
+        self._pred_cache: dict[tuple, Predicate] = {}
     
     def get_or_create_type(self, name: str) -> Type:
-        if name not in self.doc.types:
-            self.doc.types[name] = Type(name)
-        return self.doc.types[name]
+        types = self.doc.types
+        typ = types.get(name)
+        if typ is None:
+            typ = types[name] = Type(name)
+        return typ
     
     def parse(self, text: str) -> LogicalDocument:
         self.doc = LogicalDocument()
+        parse_line = self.parse_line
         
-        lines = text.strip().split("\n")
-        for i, line in enumerate(lines, 1):
-            line = line.strip()
+        for i, line in enumerate(iter_lines(text), 1):
+            line = line.translate(WS_TABLE).strip()
             
             if not line or line.startswith("#"):
                 continue
             
             try:
-                self.parse_line(line, i)
+                parse_line(line, i)
             except Exception as e:
                 raise ParseError(str(e), i, line)
         
@@ -82,7 +112,7 @@ class LogicalParser:
             raise ValueError(f"Unknown syntax: {line}")
     
     def parse_entity(self, line: str):
-        match = re.match(r"entity\s+(\w+)\s*:\s*(\w+)", line)
+        match = _ENTITY_RE.match(line)
         if not match:
             raise ValueError("Expected: entity <name> : <type>")
         
@@ -93,38 +123,47 @@ class LogicalParser:
         self.doc.entities[name] = const
     
     def parse_predicate(self, text: str, allow_variables: bool = False, variables: dict = None) -> Predicate:
-        variables = variables or {}
+        # Names resolve against `variables` first, then entities. Callers
+        # parsing several predicates with the same variables can pass a
+        # merged {**entities, **variables} scope so each arg is one probe.
+        entities = self.doc.entities
+        scope = variables or entities
         
-        match = re.match(r"(\w+)\s*\((.*)\)", text.strip())
+        match = _PREDICATE_RE.match(text.strip())
         if not match:
             raise ValueError(f"Expected predicate: pred(role: arg, ...)")
         
-        func_name = match.group(1)
+        func_name = sys.intern(match.group(1))
         args_str = match.group(2).strip()
         
         roles = []
         if args_str:
-            for arg_part in args_str.split(","):
-                arg_part = arg_part.strip()
-                role_match = re.match(r"(\w+)\s*:\s*(\w+)", arg_part)
+            for arg_part in _COMMA_SPLIT.split(args_str):
+                role_match = _NAME_PAIR_RE.match(arg_part)
                 if not role_match:
                     raise ValueError(f"Expected role: arg, got: {arg_part}")
                 
                 role_name, arg_name = role_match.groups()
-                role = RoleLabel(role_name)
+                role = self._role_cache.get(role_name)
+                if role is None:
+                    role = self._role_cache[role_name] = RoleLabel(sys.intern(role_name))
                 
-                if arg_name in variables:
-                    arg = variables[arg_name]
-                elif arg_name in self.doc.entities:
-                    arg = self.doc.entities[arg_name]
-                elif allow_variables:
-                    raise ValueError(f"Unknown variable: {arg_name}")
-                else:
+                arg = scope.get(arg_name)
+                if arg is None and scope is not entities:
+                    arg = entities.get(arg_name)
+                if arg is None:
+                    if allow_variables:
+                        raise ValueError(f"Unknown variable: {arg_name}")
                     raise ValueError(f"Unknown entity: {arg_name}")
                 
                 roles.append((role, arg))
         
-        return Predicate(func_name, tuple(roles))
+        roles = tuple(roles)
+        key = (func_name, roles)
+        pred = self._pred_cache.get(key)
+        if pred is None:
+            pred = self._pred_cache[key] = Predicate(func_name, roles)
+        return pred
     
     def parse_proposition(self, line: str):
         pred = self.parse_predicate(line, allow_variables=False)
@@ -134,13 +173,13 @@ class LogicalParser:
         """Parse: rule [x:type, y:type]: premise & premise -> conclusion [weight]"""
         # Extract weight if present
         weight = 1.0
-        weight_match = re.search(r'\[(\d+\.?\d*)\]\s*$', line)
+        weight_match = _WEIGHT_RE.search(line)
         if weight_match:
             weight = float(weight_match.group(1))
             line = line[:weight_match.start()].strip()
         
         # Extract variable declarations
-        var_match = re.match(r"rule\s*\[(.*?)\]\s*:\s*(.+)", line)
+        var_match = _RULE_RE.match(line)
         if not var_match:
             raise ValueError("Expected: rule [var:type, ...]: premise -> conclusion [weight]")
         
@@ -149,11 +188,10 @@ class LogicalParser:
         # Parse variables
         variables = {}
         var_list = []
-        for var_decl in var_decls.split(","):
-            var_decl = var_decl.strip()
+        for var_decl in _COMMA_SPLIT.split(var_decls.strip()):
             if not var_decl:
                 continue
-            vm = re.match(r"(\w+)\s*:\s*(\w+)", var_decl)
+            vm = _NAME_PAIR_RE.match(var_decl)
             if not vm:
                 raise ValueError(f"Expected var:type, got: {var_decl}")
             var_name, type_name = vm.groups()
@@ -163,18 +201,22 @@ class LogicalParser:
             var_list.append(var)
         
         # Parse premise -> conclusion
-        if "->" not in body:
+        body_match = _RULE_BODY_RE.match(body)
+        if not body_match:
             raise ValueError("Expected: premise -> conclusion")
         
-        premise_str, conclusion_str = body.split("->", 1)
+        premise_str, conclusion_str = body_match.groups()
+        
+        # One lookup table for every predicate in this rule
+        scope = {**self.doc.entities, **variables}
         
         # Handle conjunction in premise
         premises = []
-        for part in premise_str.split("&"):
-            pred = self.parse_predicate(part.strip(), allow_variables=True, variables=variables)
+        for part in _AND_SPLIT.split(premise_str):
+            pred = self.parse_predicate(part, allow_variables=True, variables=scope)
             premises.append(pred)
         
-        conclusion = self.parse_predicate(conclusion_str.strip(), allow_variables=True, variables=variables)
+        conclusion = self.parse_predicate(conclusion_str, allow_variables=True, variables=scope)
         
         rule = Rule(
             premises=premises,
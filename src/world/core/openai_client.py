@@ -0,0 +1,61 @@
+# src/world/core/openai_client.py
+"""
+Process-wide OpenAI client, and concurrent JSON completions through it.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from openai import OpenAI
+
+from world.core import codec
+
+
+# Upper bound on concurrent OpenAI requests from one batch of work
+MAX_PARALLEL_REQUESTS = 8
+
+# Retries per request on rate limits, timeouts and 5xx. The SDK backs off
+# exponentially and honours Retry-After; its default of 2 is easily used up
+# when many requests are in flight at once.
+MAX_RETRIES = 5
+
+
+@lru_cache(maxsize=None)
+def shared_openai() -> OpenAI:
+    """One OpenAI client per process, so every caller reuses its connection pool."""
+    return OpenAI(max_retries=MAX_RETRIES)
+
+
+@lru_cache(maxsize=None)
+def system_message(system_prompt: str) -> dict:
+    """Shared system message for a prompt; the client does not mutate it."""
+    return {"role": "system", "content": system_prompt}
+
+
+def json_completions(
+    client: OpenAI,
+    system_prompt: str,
+    prompts: list[str],
+    model: str = "gpt-4o-mini",
+    concurrency: int = MAX_PARALLEL_REQUESTS,
+) -> list[dict]:
+    """
+    Parsed replies to one JSON-mode chat completion per prompt, all sharing
+    system_prompt. Up to concurrency requests are in flight at once;
+    replies are in prompt order.
+    """
+    def complete(prompt: str) -> dict:
+        response = client.chat.completions.create(
+            model=model,
+            messages=[
+                system_message(system_prompt),
+                {"role": "user", "content": prompt},
+            ],
+            response_format={"type": "json_object"},
+        )
+        return codec.loads(response.choices[0].message.content)
+    
+    if len(prompts) == 1:
+        return [complete(prompts[0])]
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return list(pool.map(complete, prompts))
@@ -3,22 +3,53 @@
 Pipeline for processing examples.
 """
 
-import json
 import uuid
-from dataclasses import asdict
+from dataclasses import fields
 
 import redis
 
-from world.core.tokenize import tokenize, Token, SpellCorrector, CorrectedToken
+from world.core import codec
+from world.core.tokenize import tokenize, Token, SpellCorrector, CorrectedToken, default_known_words
 from world.core.state import get_namespace
 from world.core.analysis import SentenceAnalysis, TextAnalysis
+from world.core.logic import Predicate
 
 
 def generate_id() -> str:
     return uuid.uuid4().hex[:12]
 
 
+def to_columns(items: list, cls: type) -> dict[str, list]:
+    """Encode dataclass instances column-wise: {field: [values...]}."""
+    return {f.name: [getattr(item, f.name) for item in items] for f in fields(cls)}
+
+
+def from_columns(data: dict | list, cls: type) -> list:
+    """Decode a column-wise payload; also accepts the old list-of-dicts form."""
+    if isinstance(data, list):
+        return [cls(**d) for d in data]
+    names = list(data)
+    return [cls(**dict(zip(names, row))) for row in zip(*data.values())]
+
+
+# How each stage's stored bytes are turned back into objects
+STAGE_DECODERS = {
+    "raw": lambda data: data.decode(),
+    "tokens": lambda data: from_columns(codec.loads(data), Token),
+    "corrected": lambda data: from_columns(codec.loads(data), CorrectedToken),
+    "senses": codec.loads,
+    "segments": lambda data: [tuple(s) for s in codec.loads(data)],
+    "analysis": lambda data: TextAnalysis.from_dict(codec.loads(data)),
+    "predicates": lambda data: [Predicate.from_dict(d) for d in codec.loads(data)],
+}
+
+
 class Pipeline:
+    """
+    Runs an example through the stages. All stages of one example live as
+    fields of a single Redis hash, so reading several is one round-trip.
+    """
+
     def __init__(self, client: redis.Redis):
         self.client = client
         self._corrector = None
@@ -30,20 +61,50 @@ class Pipeline:
     @property
     def corrector(self) -> SpellCorrector:
         if self._corrector is None:
-            self._corrector = SpellCorrector()
+            self._corrector = SpellCorrector(known_words=default_known_words())
         return self._corrector
 
-    def _key(self, example_id: str, stage: str) -> str:
-        return f"{self.namespace}:example:{example_id}:{stage}"
+    def _key(self, example_id: str) -> str:
+        return f"{self.namespace}:example:{example_id}"
+
+    def _store(self, example_id: str, stage: str, value: str | bytes) -> None:
+        self.client.hset(self._key(example_id), stage, value)
+
+    def _fetch(self, example_id: str, stages: list[str]) -> list[bytes | None]:
+        """
+        Stored bytes of each stage (None if missing), in one HMGET. Stages
+        still under their old per-stage keys are read and moved into the hash.
+        """
+        key = self._key(example_id)
+        values = list(self.client.hmget(key, stages))
+        missing = [i for i, data in enumerate(values) if data is None]
+        if not missing:
+            return values
+
+        # Stages used to be stored under one string key each: {key}:{stage}
+        legacy_keys = [f"{key}:{stages[i]}" for i in missing]
+        moved = {}
+        for i, data in zip(missing, self.client.mget(legacy_keys)):
+            if data is not None:
+                values[i] = moved[stages[i]] = data
+        if moved:
+            self.client.hset(key, mapping=moved)
+            self.client.delete(*(f"{key}:{stage}" for stage in moved))
+        return values
+
+    def _load(self, example_id: str, stage: str):
+        data = self._fetch(example_id, [stage])[0]
+        if data is None:
+            return None
+        return STAGE_DECODERS[stage](data)
 
     def add(self, text: str) -> str:
         example_id = generate_id()
-        self.client.set(self._key(example_id, "raw"), text)
+        self._store(example_id, "raw", text)
         return example_id
 
     def get_raw(self, example_id: str) -> str | None:
-        raw = self.client.get(self._key(example_id, "raw"))
-        return raw.decode() if raw else None
+        return self._load(example_id, "raw")
 
     def run_tokenize(self, example_id: str) -> list[Token]:
         raw = self.get_raw(example_id)
@@ -51,17 +112,12 @@ class Pipeline:
             raise ValueError(f"Example {example_id} not found")
 
         tokens = tokenize(raw)
-        token_dicts = [asdict(t) for t in tokens]
-        self.client.set(self._key(example_id, "tokens"), json.dumps(token_dicts))
+        self._store(example_id, "tokens", codec.dumps(to_columns(tokens, Token)))
 
         return tokens
 
     def get_tokens(self, example_id: str) -> list[Token] | None:
-        data = self.client.get(self._key(example_id, "tokens"))
-        if data is None:
-            return None
-        token_dicts = json.loads(data.decode())
-        return [Token(**d) for d in token_dicts]
+        return self._load(example_id, "tokens")
 
     def run_correct(self, example_id: str) -> list[CorrectedToken]:
         tokens = self.get_tokens(example_id)
@@ -69,65 +125,51 @@ class Pipeline:
             raise ValueError(f"Tokens for {example_id} not found, run tokenize first")
 
         corrected = self.corrector.correct(tokens)
-        corrected_dicts = [asdict(c) for c in corrected]
-        self.client.set(self._key(example_id, "corrected"), json.dumps(corrected_dicts))
+        self._store(example_id, "corrected", codec.dumps(to_columns(corrected, CorrectedToken)))
 
         return corrected
 
     def get_corrected(self, example_id: str) -> list[CorrectedToken] | None:
-        data = self.client.get(self._key(example_id, "corrected"))
-        if data is None:
-            return None
-        corrected_dicts = json.loads(data.decode())
-        return [CorrectedToken(**d) for d in corrected_dicts]
+        return self._load(example_id, "corrected")
 
     def store_senses(self, example_id: str, symbols: list[str]) -> None:
-        self.client.set(self._key(example_id, "senses"), json.dumps(symbols))
+        self._store(example_id, "senses", codec.dumps(symbols))
 
     def get_senses(self, example_id: str) -> list[str] | None:
-        data = self.client.get(self._key(example_id, "senses"))
-        if data is None:
-            return None
-        return json.loads(data.decode())
+        return self._load(example_id, "senses")
 
     def store_segments(self, example_id: str, segments: list[tuple[int, int]]) -> None:
-        self.client.set(self._key(example_id, "segments"), json.dumps(segments))
+        self._store(example_id, "segments", codec.dumps(segments))
 
     def get_segments(self, example_id: str) -> list[tuple[int, int]] | None:
-        data = self.client.get(self._key(example_id, "segments"))
-        if data is None:
-            return None
-        return [tuple(s) for s in json.loads(data.decode())]
+        return self._load(example_id, "segments")
 
     def store_text_analysis(self, example_id: str, analysis: TextAnalysis) -> None:
-        self.client.set(self._key(example_id, "analysis"), json.dumps(analysis.to_dict()))
+        self._store(example_id, "analysis", codec.dumps(analysis.to_dict()))
 
     def get_text_analysis(self, example_id: str) -> TextAnalysis | None:
-        data = self.client.get(self._key(example_id, "analysis"))
-        if data is None:
-            return None
-        return TextAnalysis.from_dict(json.loads(data.decode()))
+        return self._load(example_id, "analysis")
 
-    def store_predicates(self, example_id: str, predicates: list) -> None:
-        from world.core.logic import Predicate
+    def store_predicates(self, example_id: str, predicates: list[Predicate]) -> None:
         data = [p.to_dict() for p in predicates]
-        self.client.set(self._key(example_id, "predicates"), json.dumps(data))
-
-    def get_predicates(self, example_id: str) -> list | None:
-        from world.core.logic import Predicate
-        data = self.client.get(self._key(example_id, "predicates"))
-        if data is None:
-            return None
-        return [Predicate.from_dict(d) for d in json.loads(data.decode())]
-
-    def show(self, example_id: str) -> dict:
-        return {
-            "id": example_id,
-            "raw": self.get_raw(example_id),
-            "tokens": self.get_tokens(example_id),
-            "corrected": self.get_corrected(example_id),
-            "senses": self.get_senses(example_id),
-            "segments": self.get_segments(example_id),
-            "analysis": self.get_text_analysis(example_id),
-            "predicates": self.get_predicates(example_id),
-        }
\ No newline at end of file
+        self._store(example_id, "predicates", codec.dumps(data))
+
+    def get_predicates(self, example_id: str) -> list[Predicate] | None:
+        return self._load(example_id, "predicates")
+
+    def show(self, example_id: str, stages: list[str] | None = None) -> dict:
+        """Load stages for display with one HMGET. Only requested stages are decoded."""
+        if stages is None:
+            stages = list(STAGE_DECODERS)
+        for stage in stages:
+            if stage not in STAGE_DECODERS:
+                raise ValueError(f"Unknown stage: {stage}. Available: {list(STAGE_DECODERS)}")
+
+        result = {"id": example_id}
+        if not stages:
+            return result
+
+        values = self._fetch(example_id, stages)
+        for stage, data in zip(stages, values):
+            result[stage] = STAGE_DECODERS[stage](data) if data is not None else None
+        return result
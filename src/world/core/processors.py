@@ -9,6 +9,7 @@ import redis
 from openai import OpenAI
 
 from world.core.document import DocumentStore
+from world.core.openai_client import shared_openai
 
 
 @dataclass
@@ -23,7 +24,7 @@ class Processor(ABC):
     
     def __init__(self, store: DocumentStore, openai_client: OpenAI | None = None):
         self.store = store
-        self.openai = openai_client or OpenAI()
+        self.openai = openai_client or shared_openai()
     
     def check_requirements(self, doc_id: str) -> tuple[bool, str]:
         """Check if all required stages exist."""
@@ -3,10 +3,13 @@
 Processor implementations.
 """
 
-import json
 import re
+from concurrent.futures import ThreadPoolExecutor
+
+from world.core import codec
+from world.core.openai_client import MAX_PARALLEL_REQUESTS
 from world.core.processors import Processor, ProcessorResult, register
-from world.core.tokenize import tokenize as do_tokenize
+from world.core.tokenize import tokenize as do_tokenize, Token, SpellCorrector, default_known_words
 
 
 @register
@@ -30,15 +33,19 @@ class TokenizeProcessor(Processor):
 class CorrectProcessor(Processor):
     name = "correct"
     requires = ["tokenize"]
+    _corrector: SpellCorrector | None = None
+    
+    @property
+    def corrector(self) -> SpellCorrector:
+        if self._corrector is None:
+            self._corrector = SpellCorrector(self.openai, known_words=default_known_words())
+        return self._corrector
     
     def process(self, doc_id: str) -> ProcessorResult:
-        from world.core.tokenize import Token, SpellCorrector
-        
         token_data = self.store.get_data(doc_id, "tokenize")
         tokens = [Token(**t) for t in token_data]
         
-        corrector = SpellCorrector(self.openai)
-        corrected = corrector.correct(tokens)
+        corrected = self.corrector.correct(tokens)
         
         data = [{"original": c.original, "corrected": c.corrected, "position": c.position} for c in corrected]
         self.store.set_data(doc_id, self.name, data)
@@ -56,7 +63,7 @@ class ParseClausesProcessor(Processor):
         correct_data = self.store.get_data(doc_id, "correct")
         tokens = [c["corrected"] for c in correct_data]
         
-        prompt = "Tokens:\n" + "\n".join(f"{i}: {t}" for i, t in enumerate(tokens))
+        prompt = "Tokens:\n" + "\n".join([f"{i}: {t}" for i, t in enumerate(tokens)])
         prompt += f"\n\nTotal: {len(tokens)} tokens (indices 0 to {len(tokens)-1})"
         
         response = self.openai.chat.completions.create(
@@ -68,7 +75,7 @@ class ParseClausesProcessor(Processor):
             response_format={"type": "json_object"},
         )
         
-        result = json.loads(response.choices[0].message.content)
+        result = codec.loads(response.choices[0].message.content)
         self.store.set_data(doc_id, self.name, result)
         
         n_clauses = len(result.get("clauses", []))
@@ -87,32 +94,35 @@ class ParseArgsProcessor(Processor):
         clause_data = self.store.get_data(doc_id, "parse-clauses")
         clauses = clause_data.get("clauses", [])
         
-        results = []
-        for c in clauses:
-            clause_tokens = tokens[c["start"]:c["end"]]
-            verb_rel = c["verb_index"] - c["start"]
-            
-            prompt = "Clause tokens:\n" + "\n".join(f"{i}: {t}" for i, t in enumerate(clause_tokens))
-            prompt += f"\n\nVerb: {clause_tokens[verb_rel]} (index {verb_rel})"
-            prompt += f"\nTotal: {len(clause_tokens)} tokens"
-            
-            response = self.openai.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": ARG_PROMPT},
-                    {"role": "user", "content": prompt},
-                ],
-                response_format={"type": "json_object"},
-            )
-            
-            args = json.loads(response.choices[0].message.content)
-            results.append({
-                "clause": c,
-                "arguments": args.get("arguments", []),
-            })
+        # Clauses are independent requests; issue them concurrently
+        with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as pool:
+            results = list(pool.map(lambda c: self.parse_clause(tokens, c), clauses))
         
         self.store.set_data(doc_id, self.name, results)
         return ProcessorResult(True, f"parse-args: {len(results)} clauses processed")
+    
+    def parse_clause(self, tokens: list[str], c: dict) -> dict:
+        clause_tokens = tokens[c["start"]:c["end"]]
+        verb_rel = c["verb_index"] - c["start"]
+        
+        prompt = "Clause tokens:\n" + "\n".join([f"{i}: {t}" for i, t in enumerate(clause_tokens)])
+        prompt += f"\n\nVerb: {clause_tokens[verb_rel]} (index {verb_rel})"
+        prompt += f"\nTotal: {len(clause_tokens)} tokens"
+        
+        response = self.openai.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": ARG_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            response_format={"type": "json_object"},
+        )
+        
+        args = codec.loads(response.choices[0].message.content)
+        return {
+            "clause": c,
+            "arguments": args.get("arguments", []),
+        }
 
 
 # Prompts
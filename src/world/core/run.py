@@ -2,11 +2,12 @@
 Run - a workspace for processing a doc against a KB.
 """
 
-import json
 import uuid
 from datetime import datetime
 from dataclasses import dataclass
 
+from world.core import codec
+
 
 @dataclass
 class Run:
@@ -63,7 +64,7 @@ class RunStore:
             created_at=datetime.utcnow().isoformat(),
         )
         
-        self.client.set(self._run_key(run_id), json.dumps(run.to_dict()))
+        self.client.set(self._run_key(run_id), codec.dumps(run.to_dict()))
         self.client.rpush(self._doc_runs_key(doc_id), run_id)
         
         if parent_run_id:
@@ -83,25 +84,34 @@ class RunStore:
         data = self.client.get(self._run_key(run_id))
         if not data:
             return None
-        return Run.from_dict(json.loads(data))
+        return Run.from_dict(codec.loads(data))
     
     def list_for_doc(self, doc_id: str) -> list[Run]:
         run_ids = self.client.lrange(self._doc_runs_key(doc_id), 0, -1)
-        runs = []
-        for rid in run_ids:
-            run = self.get(rid.decode())
-            if run:
-                runs.append(run)
-        return runs
+        if not run_ids:
+            return []
+        values = self.client.mget([self._run_key(rid.decode()) for rid in run_ids])
+        return [Run.from_dict(codec.loads(data)) for data in values if data]
     
     def get_data(self, run_id: str, layer_id: str) -> dict | None:
         data = self.client.get(self._run_data_key(run_id, layer_id))
         if not data:
             return None
-        return json.loads(data)
+        return codec.loads(data)
+    
+    def get_many(self, run_id: str, layer_ids: list[str]) -> dict[str, dict | None]:
+        """Load several layers' data with a single MGET."""
+        if not layer_ids:
+            return {}
+        keys = [self._run_data_key(run_id, lid) for lid in layer_ids]
+        values = self.client.mget(keys)
+        return {
+            lid: codec.loads(data) if data else None
+            for lid, data in zip(layer_ids, values)
+        }
     
     def set_data(self, run_id: str, layer_id: str, data: dict):
-        self.client.set(self._run_data_key(run_id, layer_id), json.dumps(data))
+        self.client.set(self._run_data_key(run_id, layer_id), codec.dumps(data))
     
     def has_data(self, run_id: str, layer_id: str) -> bool:
         return self.client.exists(self._run_data_key(run_id, layer_id))
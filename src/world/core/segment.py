@@ -3,9 +3,11 @@
 Segment text into sentences.
 """
 
-import json
 from openai import OpenAI
 
+from world.core import codec
+from world.core.openai_client import shared_openai
+
 
 SYSTEM_PROMPT = """You are a sentence segmenter.
 
@@ -49,7 +51,7 @@ def segment_sentences(
     """
     Returns list of (start, end) token ranges for each sentence.
     """
-    client = client or OpenAI()
+    client = client or shared_openai()
     prompt = build_prompt(tokens)
     
     response = client.chat.completions.create(
@@ -61,7 +63,7 @@ def segment_sentences(
         response_format={"type": "json_object"},
     )
     
-    result = json.loads(response.choices[0].message.content)
+    result = codec.loads(response.choices[0].message.content)
     
     sentences = [(s["start"], s["end"]) for s in result.get("sentences", [])]
     
@@ -14,8 +14,23 @@ Syntax:
 import re
 from dataclasses import dataclass, field
 
+from world.core.logical_lang import WS_TABLE, iter_lines
 
-@dataclass
+
+# Classifies and tokenizes a line in one match; the outer group that
+# matched (m.lastgroup) names the SentenceParser.parse_<kind> handler.
+_LINE_RE = re.compile(
+    r"(?P<tokens>tokens:(?P<tokens_rest>.*))"
+    r"|(?P<clause_header>clause\s+\[(?P<clause_start>\d+):(?P<clause_end>\d+)\]\s*(?P<label>\w*):)"
+    r"|(?P<verb>verb:\s*(?P<verb_text>.+?)\s*\[(?P<verb_index>\d+)\])"
+    r"|(?P<skip>skip:(?P<skip_rest>.*))"
+    r"|(?P<coref>coref:(?P<coref_rest>.*))"
+    r"|(?P<argument>(?P<role>\w+):\s*(?P<arg_text>.+?)\s*\[(?P<arg_start>\d+):(?P<arg_end>\d+)\])"
+)
+_KEYWORDS = frozenset({"tokens", "clause", "verb", "skip", "coref"})
+
+
+@dataclass(slots=True)
 class Argument:
     role: str
     text: str
@@ -23,7 +38,7 @@ class Argument:
     end: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Clause:
     start: int
     end: int
@@ -33,13 +48,13 @@ class Clause:
     arguments: list[Argument] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Coreference:
     index_a: int
     index_b: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SentenceDocument:
     tokens: list[str] = field(default_factory=list)
     clauses: list[Clause] = field(default_factory=list)
@@ -62,19 +77,20 @@ class SentenceParser:
     def parse(self, text: str) -> SentenceDocument:
         self.doc = SentenceDocument()
         self.current_clause = None
+        parse_line = self.parse_line
         
-        lines = text.strip().split("\n")
-        for i, line in enumerate(lines, 1):
-            line = line.rstrip()
+        for i, line in enumerate(iter_lines(text), 1):
+            line = line.translate(WS_TABLE)
+            stripped = line.strip()
             
             # Skip empty lines and comments
-            if not line or line.strip().startswith("#"):
+            if not stripped or stripped.startswith("#"):
                 continue
             
             try:
-                self.parse_line(line, i)
+                parse_line(stripped, i)
             except Exception as e:
-                raise SentenceParseError(str(e), i, line)
+                raise SentenceParseError(str(e), i, line.rstrip())
         
         # Finalize last clause
         if self.current_clause:
@@ -83,89 +99,76 @@ class SentenceParser:
         return self.doc
     
     def parse_line(self, line: str, line_num: int):
-        stripped = line.strip()
+        match = _LINE_RE.match(line)
+        kind = match.lastgroup if match else None
+        # A malformed keyword line (e.g. "verb: is [2:3]") can still look
+        # like an argument; report it against the keyword instead.
+        if kind == "argument" and match["role"] in _KEYWORDS:
+            kind = None
+        
+        if kind is None:
+            raise ValueError(self.syntax_error(line))
         
-        if stripped.startswith("tokens:"):
-            self.parse_tokens(stripped)
-        elif stripped.startswith("clause "):
-            self.parse_clause_header(stripped)
-        elif stripped.startswith("verb:"):
-            self.parse_verb(stripped)
-        elif stripped.startswith("skip:"):
-            self.parse_skip(stripped)
-        elif stripped.startswith("coref:"):
-            self.parse_coref(stripped)
-        elif ":" in stripped and self.current_clause:
-            # Argument line (agent:, theme:, goal:, etc.)
-            self.parse_argument(stripped)
-        else:
-            raise ValueError(f"Unknown syntax: {stripped}")
-    
-    def parse_tokens(self, line: str):
+        getattr(self, f"parse_{kind}")(match)
+    
+    def syntax_error(self, line: str) -> str:
+        """Explain why a line did not match any form of the syntax."""
+        if line.startswith("clause "):
+            return "Expected: clause [start:end] label:"
+        if line.startswith("verb:"):
+            if not self.current_clause:
+                return "verb: must be inside a clause"
+            return "Expected: verb: word [index]"
+        if ":" in line and self.current_clause:
+            return "Expected: role: span [start:end]"
+        return f"Unknown syntax: {line}"
+    
+    def parse_tokens(self, match: re.Match):
         """Parse: tokens: word word word ..."""
-        _, rest = line.split(":", 1)
-        self.doc.tokens = rest.strip().split()
+        self.doc.tokens = match["tokens_rest"].split()
     
-    def parse_clause_header(self, line: str):
+    def parse_clause_header(self, match: re.Match):
         """Parse: clause [start:end] label:"""
         # Finalize previous clause
         if self.current_clause:
             self.doc.clauses.append(self.current_clause)
         
-        match = re.match(r"clause\s+\[(\d+):(\d+)\]\s*(\w*):", line)
-        if not match:
-            raise ValueError("Expected: clause [start:end] label:")
-        
-        start, end, label = match.groups()
         self.current_clause = Clause(
-            start=int(start),
-            end=int(end),
-            label=label or "main",
+            start=int(match["clause_start"]),
+            end=int(match["clause_end"]),
+            label=match["label"] or "main",
             verb_text="",
             verb_index=-1,
         )
     
-    def parse_verb(self, line: str):
+    def parse_verb(self, match: re.Match):
         """Parse: verb: word [index]"""
         if not self.current_clause:
             raise ValueError("verb: must be inside a clause")
         
-        match = re.match(r"verb:\s*(.+?)\s*\[(\d+)\]", line)
-        if not match:
-            raise ValueError("Expected: verb: word [index]")
-        
-        text, index = match.groups()
-        self.current_clause.verb_text = text.strip()
-        self.current_clause.verb_index = int(index)
+        self.current_clause.verb_text = match["verb_text"]
+        self.current_clause.verb_index = int(match["verb_index"])
     
-    def parse_argument(self, line: str):
+    def parse_argument(self, match: re.Match):
         """Parse: role: span [start:end]"""
         if not self.current_clause:
             raise ValueError("Argument must be inside a clause")
         
-        match = re.match(r"(\w+):\s*(.+?)\s*\[(\d+):(\d+)\]", line)
-        if not match:
-            raise ValueError("Expected: role: span [start:end]")
-        
-        role, text, start, end = match.groups()
         arg = Argument(
-            role=role.strip(),
-            text=text.strip(),
-            start=int(start),
-            end=int(end),
+            role=match["role"],
+            text=match["arg_text"],
+            start=int(match["arg_start"]),
+            end=int(match["arg_end"]),
         )
         self.current_clause.arguments.append(arg)
     
-    def parse_skip(self, line: str):
+    def parse_skip(self, match: re.Match):
         """Parse: skip: index index ..."""
-        _, rest = line.split(":", 1)
-        indices = [int(x) for x in rest.strip().split()]
-        self.doc.skip_indices = indices
+        self.doc.skip_indices = [int(x) for x in match["skip_rest"].split()]
     
-    def parse_coref(self, line: str):
+    def parse_coref(self, match: re.Match):
         """Parse: coref: index_a index_b"""
-        _, rest = line.split(":", 1)
-        parts = rest.strip().split()
+        parts = match["coref_rest"].split()
         if len(parts) != 2:
             raise ValueError("Expected: coref: index_a index_b")
         
@@ -202,35 +205,47 @@ def format_sentence_doc(doc: SentenceDocument) -> str:
     return "\n".join(lines)
 
 
+def _mark_covered(covered: bytearray, start: int, end: int) -> None:
+    """Mark token range [start, end) as covered, ignoring out-of-range indices."""
+    start = max(start, 0)
+    end = min(end, len(covered))
+    if start < end:
+        covered[start:end] = b"\x01" * (end - start)
+
+
 def validate_sentence_doc(doc: SentenceDocument) -> list[str]:
     """Validate a sentence document, return list of errors."""
     errors = []
-    n_tokens = len(doc.tokens)
+    tokens = doc.tokens
+    n_tokens = len(tokens)
     
-    # Track coverage
-    covered = set(doc.skip_indices)
+    # Track coverage: one byte per token, 1 = covered
+    covered = bytearray(n_tokens)
+    for i in doc.skip_indices:
+        _mark_covered(covered, i, i + 1)
     
     for clause in doc.clauses:
+        start, end, verb_index = clause.start, clause.end, clause.verb_index
+        
         # Check clause bounds
-        if clause.start < 0 or clause.end > n_tokens:
-            errors.append(f"Clause [{clause.start}:{clause.end}] out of bounds (tokens: 0-{n_tokens})")
+        if start < 0 or end > n_tokens:
+            errors.append(f"Clause [{start}:{end}] out of bounds (tokens: 0-{n_tokens})")
         
         # Check verb index
-        if clause.verb_index < clause.start or clause.verb_index >= clause.end:
-            errors.append(f"Verb index {clause.verb_index} not in clause [{clause.start}:{clause.end}]")
+        if verb_index < start or verb_index >= end:
+            errors.append(f"Verb index {verb_index} not in clause [{start}:{end}]")
         
-        covered.add(clause.verb_index)
+        _mark_covered(covered, verb_index, verb_index + 1)
         
         # Check arguments
         for arg in clause.arguments:
-            if arg.start < clause.start or arg.end > clause.end:
-                errors.append(f"Arg {arg.role} [{arg.start}:{arg.end}] not in clause [{clause.start}:{clause.end}]")
-            covered.update(range(arg.start, arg.end))
-    
-    # Check coverage
-    missing = [i for i in range(n_tokens) if i not in covered]
-    if missing:
-        missing_tokens = [(i, doc.tokens[i]) for i in missing]
+            if arg.start < start or arg.end > end:
+                errors.append(f"Arg {arg.role} [{arg.start}:{arg.end}] not in clause [{start}:{end}]")
+            _mark_covered(covered, arg.start, arg.end)
+    
+    # Check coverage; the common all-covered case is a single C-level scan
+    if 0 in covered:
+        missing_tokens = [(i, tokens[i]) for i, c in enumerate(covered) if not c]
         errors.append(f"Uncovered tokens: {missing_tokens}")
     
     # Check coreferences
@@ -6,76 +6,232 @@ Stage 1: Raw text → tokens
 Stage 2: Tokens → spell-corrected tokens (via LLM)
 """
 
-import json
 import re
-from dataclasses import dataclass
+import threading
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache
 from openai import OpenAI
 
+from world.core import codec
+from world.core.openai_client import shared_openai
 
-@dataclass
+# pyspellchecker is optional: its English word list feeds the local prefilter
+try:
+    from spellchecker import SpellChecker
+except ImportError:
+    SpellChecker = None
+
+
+@dataclass(slots=True)
 class Token:
     text: str
     position: int  # character offset in original
 
 
-@dataclass 
+@dataclass(slots=True)
 class CorrectedToken:
     original: str
     corrected: str
     position: int
 
 
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
 def tokenize(text: str) -> list[Token]:
     """Split text into tokens, tracking positions."""
-    tokens = []
-    for match in re.finditer(r"\w+|[^\w\s]", text):
-        tokens.append(Token(text=match.group(), position=match.start()))
-    return tokens
+    if not text:
+        return []
+    return [Token(match.group(), match.start()) for match in _TOKEN_RE.finditer(text)]
 
 
 SPELLING_SYSTEM_PROMPT = """You are a spell correction system.
 
-Given a list of tokens, return the corrected spelling for each.
-Preserve intentional stylistic choices (names, technical terms).
-Only fix clear typos.
+Each input line is one text, already split into tokens by single spaces.
+Find the misspelled tokens. Preserve intentional stylistic choices (names,
+technical terms). Only fix clear typos.
 
-Respond with JSON: a list of corrected tokens in the same order.
+Respond with JSON mapping each misspelled token to its correction. Leave
+correct tokens out; if nothing is misspelled, return an empty object.
 
 Example:
-Input: ["I", "wentt", "to", "teh", "bank"]
-Output: {"tokens": ["I", "went", "to", "the", "bank"]}
+Input:
+I wentt to teh bank
+teh dog barked
+Output: {"corrections": {"wentt": "went", "teh": "the"}}
 """
 
 
+@lru_cache(maxsize=None)
+def default_known_words() -> frozenset[str]:
+    """Lower-case English words from pyspellchecker (the "spell" extra); empty if it is not installed."""
+    if SpellChecker is None:
+        return frozenset()
+    return frozenset(SpellChecker().word_frequency.keys())
+
+
+# Cap on remembered LLM verdicts, so a long-lived corrector stays bounded
+MAX_REMEMBERED_WORDS = 100_000
+
+
 class SpellCorrector:
-    def __init__(self, openai_client: OpenAI | None = None):
-        self.client = openai_client or OpenAI()
+    """
+    LLM spell correction with a local prefilter: tokens with no letters,
+    words in known_words, and words the LLM has already judged never go back
+    to it.
+
+    Remembered verdicts are context-free: a word's first verdict is reused
+    wherever it later appears. Texts that are sent get the model's in-context
+    verdict for every one of their words.
+    """
+
+    def __init__(self, openai_client: OpenAI | None = None, known_words: Iterable[str] = ()):
+        self.client = openai_client or shared_openai()
+        # A frozenset (such as default_known_words()) is taken as already lower-case
+        if not isinstance(known_words, frozenset):
+            known_words = frozenset(w.lower() for w in known_words)
+        self.known_words = known_words
+        self._verdicts: dict[str, str] = {}  # token text -> correction (itself if fine)
+
+    def _needs_check(self, text: str) -> bool:
+        """Whether a token is a word worth asking the LLM about."""
+        return any(c.isalpha() for c in text) and text.lower() not in self.known_words
+
+    def _resolve(self, text: str) -> str | None:
+        """Correction for a token without asking the LLM, or None if unknown."""
+        if not self._needs_check(text):
+            return text
+        return self._verdicts.get(text)
 
     def correct(self, tokens: list[Token]) -> list[CorrectedToken]:
-        if not tokens:
-            return []
-
-        token_texts = [t.text for t in tokens]
+        return self.correct_batch([tokens])[0]
+
+    def correct_batch(self, batches: list[list[Token]]) -> list[list[CorrectedToken]]:
+        """Correct several token lists with at most one LLM call."""
+        resolve = self._resolve
+        unchecked = [
+            tokens for tokens in batches
+            if any(resolve(t.text) is None for t in tokens)
+        ]
+        fresh = self._ask(unchecked) if unchecked else {}
+
+        return [
+            [
+                CorrectedToken(
+                    original=t.text,
+                    corrected=fresh.get(t.text) or resolve(t.text) or t.text,
+                    position=t.position,
+                )
+                for t in tokens
+            ]
+            for tokens in batches
+        ]
+
+    def _ask(self, batches: list[list[Token]]) -> dict[str, str]:
+        """
+        Send whole texts (for context) to the LLM. Returns its verdict for
+        every word in them, and remembers those verdicts for later calls.
+        """
+        # Tokens never contain whitespace, so plain text is unambiguous and far
+        # cheaper in prompt tokens than a JSON array; the reply lists only typos.
+        text = "\n".join(" ".join(t.text for t in tokens) for tokens in batches)
 
         response = self.client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": SPELLING_SYSTEM_PROMPT},
-                {"role": "user", "content": json.dumps(token_texts)},
+                {"role": "user", "content": text},
             ],
             response_format={"type": "json_object"},
         )
 
-        result = json.loads(response.choices[0].message.content)
-        corrected_texts = result.get("tokens", result)
+        result = codec.loads(response.choices[0].message.content)
+        corrections = result.get("corrections")
+        if not isinstance(corrections, dict):
+            corrections = {}
+
+        fresh = {}
+        for tokens in batches:
+            for t in tokens:
+                if t.text not in fresh and self._needs_check(t.text):
+                    fresh[t.text] = corrections.get(t.text, t.text)
+
+        # Make room before remembering, so this call's verdicts all survive
+        verdicts = self._verdicts
+        if len(verdicts) + len(fresh) > MAX_REMEMBERED_WORDS:
+            verdicts.clear()
+        verdicts.update(fresh)
+        return fresh
 
-        # Pair up with originals
-        corrected = []
-        for token, corrected_text in zip(tokens, corrected_texts):
-            corrected.append(CorrectedToken(
-                original=token.text,
-                corrected=corrected_text,
-                position=token.position,
-            ))
 
-        return corrected
\ No newline at end of file
+@dataclass
+class _PendingBatch:
+    items: list[list[Token]] = field(default_factory=list)
+    go: threading.Event = field(default_factory=threading.Event)  # this batch's turn to run
+    done: threading.Event = field(default_factory=threading.Event)
+    results: list[list[CorrectedToken]] | None = None
+    error: Exception | None = None
+
+
+class SpellBatcher:
+    """
+    Coalesces correct() calls made concurrently from different threads into
+    SpellCorrector.correct_batch() calls.
+
+    A caller that finds no call in flight runs its own right away. Callers
+    that arrive while one is in flight queue up (max_batch_size per batch),
+    and each queued batch runs as one call when the one before it is done;
+    its first caller makes the call and hands every caller its own result.
+    """
+
+    def __init__(self, corrector: SpellCorrector, max_batch_size: int = 32):
+        self.corrector = corrector
+        self.max_batch_size = max_batch_size
+        self._lock = threading.Lock()
+        self._busy = False  # a correct/correct_batch call is in flight
+        self._queue: deque[_PendingBatch] = deque()
+
+    def correct(self, tokens: list[Token]) -> list[CorrectedToken]:
+        with self._lock:
+            solo = not self._busy
+            if solo:
+                self._busy = True
+            else:
+                batch = self._queue[-1] if self._queue else None
+                if batch is None or len(batch.items) >= self.max_batch_size:
+                    batch = _PendingBatch()
+                    self._queue.append(batch)
+                batch.items.append(tokens)
+                index = len(batch.items) - 1
+
+        if solo:
+            try:
+                return self.corrector.correct(tokens)
+            finally:
+                self._next()
+
+        if index == 0:
+            batch.go.wait()
+            try:
+                batch.results = self.corrector.correct_batch(batch.items)
+            except Exception as e:
+                batch.error = e
+            finally:
+                batch.done.set()
+                self._next()
+        else:
+            batch.done.wait()
+
+        if batch.error is not None:
+            raise batch.error
+        return batch.results[index]
+
+    def _next(self) -> None:
+        """Start the oldest queued batch (closing it to new callers), or go idle."""
+        with self._lock:
+            if self._queue:
+                self._queue.popleft().go.set()
+            else:
+                self._busy = False
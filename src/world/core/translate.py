@@ -3,44 +3,81 @@
 Translate SentenceAnalysis to Predicate (logical form).
 """
 
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+
 from world.core.analysis import SentenceAnalysis, Argument as SynArg, ArgType
 from world.core.logic import Predicate, RoleLabel, Constant, Entity, Type
 
 
+# Guess entity type from role (rough heuristic)
+ROLE_TYPES = MappingProxyType({
+    "agent": "entity",
+    "patient": "entity",
+    "theme": "entity",
+    "goal": "place",
+    "source": "place",
+    "location": "place",
+    "instrument": "thing",
+    "time": "time",
+})
+
+
+@lru_cache(maxsize=512)
+def role_label(name: str) -> RoleLabel:
+    """Shared RoleLabel per role name; a corpus only uses a handful of roles."""
+    return RoleLabel(sys.intern(name))
+
+
+@lru_cache(maxsize=16384)
+def default_sense(word: str) -> str:
+    """Interned "<word>.0", the sense used when WSD has nothing better."""
+    return sys.intern(f"{word}.0")
+
+
+@lru_cache(maxsize=8192)
+def make_constant(sense: str, entity_type: str) -> Constant:
+    """Shared Constant for a sense and type; these are immutable, so reuse is safe."""
+    return Constant(Entity(sense), Type(entity_type))
+
+
+def senses_by_head(senses: list[str] | None) -> dict[str, str]:
+    """Map each word to its first sense, e.g. "bank" -> "bank.1"."""
+    by_head = {}
+    for s in senses or ():
+        by_head.setdefault(s.split(".", 1)[0], s)
+    return by_head
+
+
+def span_head(tokens: list[str], start: int, end: int) -> str:
+    """Last token of tokens[start:end], without slicing. Raises ValueError if the span is empty."""
+    last = min(end, len(tokens)) - 1
+    if last < start:
+        raise ValueError(f"Empty argument span [{start}:{end}]")
+    return tokens[last]
+
+
 def translate_np(tokens: list[str], arg: SynArg, senses: list[str] | None) -> Constant:
     """
     Translate an NP argument to a Constant.
     
     For now, uses the head word. Could be smarter about this.
     """
-    # Get the tokens for this span
-    span_tokens = tokens[arg.start:arg.end]
-    
+    return _translate_np([t.lower() for t in tokens], arg, senses_by_head(senses))
+
+
+def _translate_np(lower_tokens: list[str], arg: SynArg, sense_by_head: dict[str, str]) -> Constant:
+    """translate_np, with lower-cased tokens and the sense lookup built once per analysis."""
     # Simple heuristic: last word is usually the head for NPs
-    head = span_tokens[-1].lower()
+    head = span_head(lower_tokens, arg.start, arg.end)
     
-    # If we have senses, try to find the sense for this token
-    sense = f"{head}.0"  # default
-    if senses:
-        for s in senses:
-            if s.startswith(head + "."):
-                sense = s
-                break
+    # Use the head's sense if WSD found one
+    sense = sense_by_head.get(head) or default_sense(head)
     
-    # Guess type from role (rough heuristic)
-    type_map = {
-        "agent": "entity",
-        "patient": "entity", 
-        "theme": "entity",
-        "goal": "place",
-        "source": "place",
-        "location": "place",
-        "instrument": "thing",
-        "time": "time",
-    }
-    entity_type = type_map.get(arg.role, "entity")
+    entity_type = ROLE_TYPES.get(arg.role, "entity")
     
-    return Constant(Entity(sense), Type(entity_type))
+    return make_constant(sense, entity_type)
 
 
 def translate_analysis(
@@ -59,51 +96,84 @@ def translate_analysis(
     Returns:
         A Predicate representing the logical form
     """
+    if not analysis.arguments:
+        # Bare verb: no need to lower-case every token or index the senses
+        if analysis.verb_index is None:
+            raise ValueError("No verb in analysis")
+        if senses and analysis.verb_index < len(senses):
+            return Predicate(senses[analysis.verb_index], ())
+        return Predicate(default_sense(tokens[analysis.verb_index].lower()), ())
+    
+    lower_tokens = [t.lower() for t in tokens]
+    return _translate_analysis(analysis, lower_tokens, senses, senses_by_head(senses))
+
+
+def _translate_analysis(
+    analysis: SentenceAnalysis,
+    lower_tokens: list[str],
+    senses: list[str] | None,
+    sense_by_head: dict[str, str],
+) -> Predicate:
+    """translate_analysis, with lower-cased tokens and the sense lookup built once for all nested clauses."""
     # Get verb sense
     if analysis.verb_index is None:
         raise ValueError("No verb in analysis")
     
-    verb_token = tokens[analysis.verb_index].lower()
-    verb_sense = f"{verb_token}.0"  # default
     if senses and analysis.verb_index < len(senses):
         verb_sense = senses[analysis.verb_index]
+    else:
+        verb_sense = default_sense(lower_tokens[analysis.verb_index])
     
     # Translate arguments
     roles = []
     for arg in analysis.arguments:
-        role = RoleLabel(arg.role)
+        role = role_label(arg.role)
         
         if arg.arg_type == ArgType.S and arg.nested:
             # Intensional argument - recursive translation
-            nested_pred = translate_analysis(arg.nested, tokens, senses)
+            nested_pred = _translate_analysis(arg.nested, lower_tokens, senses, sense_by_head)
             roles.append((role, nested_pred))
         
         elif arg.arg_type in (ArgType.NP, ArgType.PP):
             # Entity argument
-            const = translate_np(tokens, arg, senses)
+            const = _translate_np(lower_tokens, arg, sense_by_head)
             roles.append((role, const))
         
         else:
             # Other types - treat as entity for now
-            const = translate_np(tokens, arg, senses)
+            const = _translate_np(lower_tokens, arg, sense_by_head)
             roles.append((role, const))
     
     return Predicate(verb_sense, tuple(roles))
 
 
+# Indentation strings for format_predicate, built once
+_PREFIXES = ["  " * i for i in range(64)]
+
+
 def format_predicate(pred: Predicate, indent: int = 0) -> str:
     """Pretty print a predicate."""
-    prefix = "  " * indent
-    lines = [f"{prefix}{pred.function_name}("]
+    lines = []
+    _format_predicate_lines(pred, indent, _indent(indent), lines)
+    return "\n".join(lines)
+
+
+def _indent(level: int) -> str:
+    return _PREFIXES[level] if level < len(_PREFIXES) else "  " * level
+
+
+def _format_predicate_lines(pred: Predicate, indent: int, head: str, lines: list[str]) -> None:
+    """Append pred's lines to `lines`; `head` starts its first line (indent or "role: ")."""
+    prefix = _indent(indent)
+    lines.append(f"{head}{pred.function_name}(")
     
     for role, arg in pred.roles:
         if isinstance(arg, Predicate):
-            nested = format_predicate(arg, indent + 1)
-            lines.append(f"{prefix}  {role.name}: {nested.strip()},")
+            _format_predicate_lines(arg, indent + 1, f"{prefix}  {role.name}: ", lines)
+            lines[-1] += ","
         elif isinstance(arg, Constant):
             lines.append(f"{prefix}  {role.name}: {arg.entity.id},")
         else:
             lines.append(f"{prefix}  {role.name}: {arg},")
     
     lines.append(f"{prefix})")
-    return "\n".join(lines)
\ No newline at end of file
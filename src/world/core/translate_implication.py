@@ -3,12 +3,17 @@
 Translate implication analysis to ImplicationLink.
 """
 
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+
 from world.core.analysis import SentenceAnalysis
 from world.core.analyze_implication import ImplicationStructure
 from world.core.analyze_verb import analyze_verb
 from world.core.analyze_args import analyze_args
 from world.core.implication import ImplicationLink
-from world.core.logic import Predicate, Variable, RoleLabel, Type
+from world.core.logic import Predicate, Variable, Type
+from world.core.translate import make_constant, span_head, role_label, default_sense
+from world.core.openai_client import shared_openai
 
 from openai import OpenAI
 
@@ -21,17 +26,18 @@ def translate_implication(
     """
     Translate an ImplicationStructure to an ImplicationLink.
     """
-    client = client or OpenAI()
-    
-    # Parse antecedent
-    ant_tokens = tokens[impl_struct.antecedent_start:impl_struct.antecedent_end]
-    ant_analysis = analyze_verb(ant_tokens, impl_struct.antecedent_start, client)
-    ant_analysis = analyze_args(ant_tokens, ant_analysis, client, recursive=False)
+    client = client or shared_openai()
     
-    # Parse consequent
-    con_tokens = tokens[impl_struct.consequent_start:impl_struct.consequent_end]
-    con_analysis = analyze_verb(con_tokens, impl_struct.consequent_start, client)
-    con_analysis = analyze_args(con_tokens, con_analysis, client, recursive=False)
+    # Antecedent and consequent are analyzed independently; run them concurrently
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        ant_future = pool.submit(
+            _analyze_span, tokens, impl_struct.antecedent_start, impl_struct.antecedent_end, client,
+        )
+        con_future = pool.submit(
+            _analyze_span, tokens, impl_struct.consequent_start, impl_struct.consequent_end, client,
+        )
+        ant_analysis = ant_future.result()
+        con_analysis = con_future.result()
     
     # Build variable map from coreferences
     # Each coreference pair shares a variable
@@ -47,8 +53,9 @@ def translate_implication(
         variables.append(var)
     
     # Translate analyses to predicates with variables
-    premise = analysis_to_predicate_with_vars(ant_analysis, tokens, index_to_var)
-    conclusion = analysis_to_predicate_with_vars(con_analysis, tokens, index_to_var)
+    lower_tokens = [t.lower() for t in tokens]
+    premise = analysis_to_predicate_with_vars(ant_analysis, lower_tokens, index_to_var)
+    conclusion = analysis_to_predicate_with_vars(con_analysis, lower_tokens, index_to_var)
     
     return ImplicationLink(
         premise=premise,
@@ -57,40 +64,50 @@ def translate_implication(
     )
 
 
+def _analyze_span(tokens: list[str], start: int, end: int, client: OpenAI) -> SentenceAnalysis:
+    """Find the verb and its arguments within tokens[start:end]."""
+    span_tokens = tokens[start:end]
+    analysis = analyze_verb(span_tokens, start, client)
+    return analyze_args(span_tokens, analysis, client, recursive=False)
+
+
 def analysis_to_predicate_with_vars(
     analysis: SentenceAnalysis,
-    tokens: list[str],
+    lower_tokens: list[str],
     index_to_var: dict[int, Variable],
 ) -> Predicate:
     """
     Convert analysis to predicate, using variables where coreferences exist.
-    """
-    from world.core.logic import Constant, Entity
     
+    lower_tokens are the sentence tokens, already lower-cased.
+    """
     if analysis.verb_index is None:
         raise ValueError("No verb in analysis")
     
-    verb_token = tokens[analysis.verb_index].lower()
-    verb_sense = f"{verb_token}.0"
+    verb_sense = default_sense(lower_tokens[analysis.verb_index])
+    
+    # Only coreferent tokens are bound, so search those rather than every span index
+    bound_indices = sorted(index_to_var)
     
     roles = []
     for arg in analysis.arguments:
-        role = RoleLabel(arg.role)
+        role = role_label(arg.role)
         
-        # Check if any token in this arg's span has a variable binding
+        # First bound index inside this arg's span, if any
         var_for_arg = None
-        for idx in range(arg.start, arg.end):
-            if idx in index_to_var:
-                var_for_arg = index_to_var[idx]
-                break
+        i = bisect_left(bound_indices, arg.start)
+        if i < len(bound_indices) and bound_indices[i] < arg.end:
+            var_for_arg = index_to_var[bound_indices[i]]
         
         if var_for_arg:
             roles.append((role, var_for_arg))
         else:
             # No variable - use constant
-            span = tokens[arg.start:arg.end]
-            head = span[-1].lower() if span else "unknown"
-            const = Constant(Entity(f"{head}.0"), Type("entity"))
+            try:
+                head = span_head(lower_tokens, arg.start, arg.end)
+            except ValueError:
+                head = "unknown"
+            const = make_constant(default_sense(head), "entity")
             roles.append((role, const))
     
     return Predicate(verb_sense, tuple(roles))
\ No newline at end of file
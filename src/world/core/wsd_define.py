@@ -5,6 +5,8 @@ WSD Step 2: Define a new sense for a token.
 
 from openai import OpenAI
 
+from world.core.openai_client import shared_openai
+
 
 SYSTEM_PROMPT = """You are a word sense disambiguation system.
 
@@ -30,7 +32,7 @@ def define_sense(
     """
     Returns a definition string for the new sense.
     """
-    client = client or OpenAI()
+    client = client or shared_openai()
     prompt = build_prompt(token, sentence)
     
     response = client.chat.completions.create(
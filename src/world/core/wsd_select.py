@@ -6,6 +6,7 @@ WSD Step 1: Given a token and existing senses, pick one or say 'add'.
 from openai import OpenAI
 
 from world.core.lexicon import Sense
+from world.core.openai_client import shared_openai
 
 
 SYSTEM_PROMPT = """You are a word sense disambiguation system.
@@ -47,7 +48,7 @@ def select_sense(
     """
     Returns sense index (int) if picked, or 'add' if new sense needed.
     """
-    client = client or OpenAI()
+    client = client or shared_openai()
     prompt = build_prompt(token, sentence, senses)
     
     response = client.chat.completions.create(
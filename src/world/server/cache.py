@@ -0,0 +1,15 @@
+"""
+Short-lived Redis cache for whole response bodies.
+"""
+
+# Seconds a cached listing may be served before it is rebuilt
+LIST_CACHE_TTL = 60
+
+
+def cached_body(client, key: str, build) -> bytes:
+    """JSON body cached at key; on a miss, build() makes it and it is stored for LIST_CACHE_TTL."""
+    body = client.get(key)
+    if body is None:
+        body = build()
+        client.set(key, body, ex=LIST_CACHE_TTL)
+    return body
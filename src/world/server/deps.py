@@ -2,29 +2,68 @@
 Shared dependencies for routes.
 """
 
+from functools import lru_cache
+
 import redis
 from openai import OpenAI
 
 from world.core.document import DocumentStore
 from world.core.run import RunStore
 from world.core.kb import KBStore
+from world.core.layers.runner import LayerRunner
+from world.core.openai_client import shared_openai
+
+
+# One connection pool per db, shared by every request for the life of the server
+_POOLS: dict[int, redis.ConnectionPool] = {}
+
+# Per-db connection cap; requests beyond it wait for a free connection
+# rather than opening sockets without bound
+REDIS_MAX_CONNECTIONS = 32
+
+
+def _pool(db: int) -> redis.ConnectionPool:
+    pool = _POOLS.get(db)
+    if pool is None:
+        pool = _POOLS.setdefault(db, redis.BlockingConnectionPool(
+            host="localhost", port=6379, db=db, max_connections=REDIS_MAX_CONNECTIONS,
+        ))
+    return pool
 
 
 def get_redis(db: int = 0):
-    return redis.Redis(host="localhost", port=6379, db=db)
+    return redis.Redis(connection_pool=_pool(db))
 
 
+def close_redis_pools() -> None:
+    """Drop every pooled Redis connection (called on server shutdown)."""
+    for pool in _POOLS.values():
+        pool.disconnect()
+
+
+# Stores and the runner only wrap a pooled client, so one of each per db
+# is shared by every request (routes take them via Depends)
+
+@lru_cache(maxsize=None)
 def get_doc_store(db: int = 0) -> DocumentStore:
     return DocumentStore(get_redis(db))
 
 
+@lru_cache(maxsize=None)
 def get_run_store(db: int = 0) -> RunStore:
     return RunStore(get_redis(db))
 
 
+@lru_cache(maxsize=None)
 def get_kb_store(db: int = 0) -> KBStore:
     return KBStore(get_redis(db))
 
 
+@lru_cache(maxsize=None)
+def get_layer_runner(db: int = 0) -> LayerRunner:
+    return LayerRunner(get_doc_store(db), get_run_store(db), get_kb_store(db))
+
+
 def get_openai() -> OpenAI:
-    return OpenAI()
\ No newline at end of file
+    # One client per process: requests share its pooled, kept-alive connections
+    return shared_openai()
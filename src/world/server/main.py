@@ -3,36 +3,43 @@ QBBN API Server.
 """
 
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+
+import anyio.to_thread
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.routing import APIRoute
 
-# Import layers to register them
-import world.core.layers.base
-import world.core.layers.clauses
-import world.core.layers.args
-import world.core.layers.coref
-import world.core.layers.entities
-import world.core.layers.link
-import world.core.layers.logic
-import world.core.layers.ground
+from world.core.layers import register_all_layers
 
 # Import routers
 from world.server.routes import docs, runs, layers, kbs
+from world.server.deps import close_redis_pools, get_layer_runner
+from world.server.responses import FastJSONResponse
 
 
-def print_routes(app: FastAPI):
-    print("\n" + "=" * 60)
-    print("QBBN API Routes")
-    print("=" * 60)
-    
+# Route handlers are sync and run on anyio's threadpool (Redis and OpenAI
+# calls block). Long layer runs hold a thread for seconds, so allow more
+# than anyio's default of 40; Redis use is bounded by the pool cap instead.
+SERVER_THREADS = 100
+
+
+def route_snapshot(app: FastAPI) -> list[tuple[str, str, str]]:
+    """(methods, path, name) for every API route, sorted by path then methods."""
     routes = []
     for route in app.routes:
         if isinstance(route, APIRoute):
-            methods = ", ".join(route.methods - {"HEAD", "OPTIONS"})
+            methods = ", ".join(sorted(route.methods - {"HEAD", "OPTIONS"}))
             routes.append((methods, route.path, route.name))
     
     routes.sort(key=lambda r: (r[1], r[0]))
+    return routes
+
+
+def print_routes(routes: list[tuple[str, str, str]]):
+    print("\n" + "=" * 60)
+    print("QBBN API Routes")
+    print("=" * 60)
     
     for methods, path, name in routes:
         print(f"  {methods:8} {path:40} → {name}")
@@ -42,11 +49,19 @@ def print_routes(app: FastAPI):
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    print_routes(app)
+    # Routes are fixed once the app is built, so walk and sort them once
+    app.state.routes_snapshot = route_snapshot(app)
+    print_routes(app.state.routes_snapshot)
+    # Build the default db's pool, stores and runner before the first request
+    get_layer_runner()
+    # Layers register on first use; do it now so the first request doesn't pay
+    register_all_layers()
+    anyio.to_thread.current_default_thread_limiter().total_tokens = SERVER_THREADS
     yield
+    close_redis_pools()
 
 
-app = FastAPI(title="QBBN API", lifespan=lifespan)
+app = FastAPI(title="QBBN API", lifespan=lifespan, default_response_class=FastJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -56,6 +71,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# DSL text and layer data compress well; tiny bodies aren't worth it
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 app.include_router(docs.router)
 app.include_router(kbs.router)
 app.include_router(runs.router)
@@ -64,4 +82,18 @@ app.include_router(layers.router)
 
 @app.get("/")
 async def root():
-    return {"name": "QBBN API", "version": "0.1.0"}
\ No newline at end of file
+    return {"name": "QBBN API", "version": "0.1.0"}
+
+
+@app.get("/api/_routes")
+async def list_routes(request: Request):
+    """The route table printed at startup."""
+    routes = getattr(request.app.state, "routes_snapshot", None)
+    if routes is None:
+        routes = request.app.state.routes_snapshot = route_snapshot(request.app)
+    return {
+        "routes": [
+            {"methods": methods, "path": path, "name": name}
+            for methods, path, name in routes
+        ]
+    }
@@ -0,0 +1,37 @@
+"""
+JSON encoding for API responses.
+"""
+
+import hashlib
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+
+from world.core import codec
+
+
+def json_bytes(content) -> bytes:
+    """Encode content as compact JSON bytes (see world.core.codec)."""
+    return codec.dumps(content)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse encoded by json_bytes."""
+    
+    def render(self, content) -> bytes:
+        return json_bytes(content)
+
+
+def etag_response(request: Request, content) -> Response:
+    """
+    JSON response tagged with a hash of its body. A client that sends the
+    same tag back in If-None-Match gets an empty 304 instead.
+    """
+    body = json_bytes(content)
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=0, must-revalidate"}
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
@@ -2,13 +2,18 @@
 Document routes: /api/docs
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import Response
 from pydantic import BaseModel
 from typing import Optional
 
-from world.server.deps import get_doc_store, get_run_store, get_openai
+from world.core.document import DocumentStore
+from world.core.run import RunStore
+from world.server.deps import get_doc_store, get_run_store, get_openai, get_layer_runner
+from world.server.cache import cached_body
+from world.server.responses import json_bytes, etag_response
 from world.core.layers import get_layer
-from world.core.layers.runner import run_layer_on_doc
+from world.core.layers.runner import LayerRunner, run_layer_on_doc, run_layers_on_doc
 
 
 router = APIRouter(prefix="/api/docs", tags=["docs"])
@@ -22,6 +27,11 @@ class RunLayerRequest(BaseModel):
     force: bool = False
 
 
+class RunLayersRequest(BaseModel):
+    layers: list[str]
+    force: bool = False
+
+
 class SetLayerRequest(BaseModel):
     dsl: str
 
@@ -29,9 +39,13 @@ class SetLayerRequest(BaseModel):
 # === Document CRUD ===
 
 @router.get("")
-async def list_docs(db: int = 0):
+def list_docs(store: DocumentStore = Depends(get_doc_store)):
     """List all documents."""
-    store = get_doc_store(db)
+    body = cached_body(store.client, store.list_cache_key(), lambda: json_bytes(_doc_list(store)))
+    return Response(body, media_type="application/json")
+
+
+def _doc_list(store: DocumentStore) -> dict:
     docs = store.list_all()
     return {
         "docs": [
@@ -42,17 +56,15 @@ async def list_docs(db: int = 0):
 
 
 @router.post("")
-async def create_doc(req: CreateDocRequest, db: int = 0):
+def create_doc(req: CreateDocRequest, store: DocumentStore = Depends(get_doc_store)):
     """Create a new document."""
-    store = get_doc_store(db)
     doc_id = store.add(req.text)
     return {"id": doc_id}
 
 
 @router.get("/{doc_id}")
-async def get_doc(doc_id: str, db: int = 0):
+def get_doc(doc_id: str, store: DocumentStore = Depends(get_doc_store)):
     """Get a document by ID."""
-    store = get_doc_store(db)
     doc = store.get(doc_id)
     if not doc:
         raise HTTPException(status_code=404, detail="Document not found")
@@ -69,18 +81,16 @@ async def get_doc(doc_id: str, db: int = 0):
 
 
 @router.delete("/{doc_id}")
-async def delete_doc(doc_id: str, db: int = 0):
+def delete_doc(doc_id: str, store: DocumentStore = Depends(get_doc_store)):
     """Delete a document."""
-    store = get_doc_store(db)
     if not store.delete(doc_id):
         raise HTTPException(status_code=404, detail="Document not found")
     return {"success": True}
 
 
 @router.get("/{doc_id}/runs")
-async def list_doc_runs(doc_id: str, db: int = 0):
+def list_doc_runs(doc_id: str, run_store: RunStore = Depends(get_run_store)):
     """List all runs for a document."""
-    run_store = get_run_store(db)
     runs = run_store.list_for_doc(doc_id)
     return {
         "runs": [r.to_dict() for r in runs]
@@ -90,15 +100,20 @@ async def list_doc_runs(doc_id: str, db: int = 0):
 # === Layer operations ===
 
 @router.post("/{doc_id}/layers/{layer_id}/run")
-async def run_layer(doc_id: str, layer_id: str, req: Optional[RunLayerRequest] = None, db: int = 0):
+def run_layer(
+    doc_id: str,
+    layer_id: str,
+    req: Optional[RunLayerRequest] = None,
+    store: DocumentStore = Depends(get_doc_store),
+    runner: LayerRunner = Depends(get_layer_runner),
+):
     """Run a layer on a document."""
-    store = get_doc_store(db)
     doc = store.get(doc_id)
     if not doc:
         raise HTTPException(status_code=404, detail="Document not found")
     
     force = req.force if req else False
-    context = {"openai": get_openai()}
+    context = {"openai": get_openai(), "spell_batcher": runner.spell_batcher}
     
     result = run_layer_on_doc(store, doc, layer_id, force=force, context=context)
     
@@ -109,15 +124,53 @@ async def run_layer(doc_id: str, layer_id: str, req: Optional[RunLayerRequest] =
     }
 
 
+@router.post("/{doc_id}/layers/run")
+def run_layers(
+    doc_id: str,
+    req: RunLayersRequest,
+    store: DocumentStore = Depends(get_doc_store),
+    runner: LayerRunner = Depends(get_layer_runner),
+):
+    """Run several layers on a document in one request."""
+    doc = store.get(doc_id)
+    if not doc:
+        raise HTTPException(status_code=404, detail="Document not found")
+    
+    context = {"openai": get_openai(), "spell_batcher": runner.spell_batcher}
+    results = run_layers_on_doc(store, doc, req.layers, force=req.force, context=context)
+    
+    return {
+        "doc_id": doc_id,
+        "results": [
+            {"layer_id": lid, "success": r.success, "message": r.message}
+            for lid, r in results.items()
+        ],
+    }
+
+
+@router.get("/{doc_id}/layers")
+def get_layers_data(
+    doc_id: str,
+    ids: Optional[str] = None,
+    store: DocumentStore = Depends(get_doc_store),
+):
+    """Get several layers' data as JSON (comma-separated ids; default: every computed layer)."""
+    doc = store.get(doc_id)
+    if not doc:
+        raise HTTPException(status_code=404, detail="Document not found")
+    
+    layer_ids = ids.split(",") if ids else store.list_stages(doc_id)
+    
+    return {"doc_id": doc_id, "layers": store.get_many(doc_id, layer_ids)}
+
+
 @router.get("/{doc_id}/layers/{layer_id}")
-async def get_layer_data(doc_id: str, layer_id: str, db: int = 0):
+def get_layer_data(doc_id: str, layer_id: str, store: DocumentStore = Depends(get_doc_store)):
     """Get layer data as JSON."""
-    store = get_doc_store(db)
-    doc = store.get(doc_id)
+    doc, data = store.get_with_data(doc_id, layer_id)
     if not doc:
         raise HTTPException(status_code=404, detail="Document not found")
     
-    data = store.get_data(doc_id, layer_id)
     if data is None:
         raise HTTPException(status_code=404, detail=f"Layer {layer_id} not run yet")
     
@@ -125,27 +178,34 @@ async def get_layer_data(doc_id: str, layer_id: str, db: int = 0):
 
 
 @router.get("/{doc_id}/layers/{layer_id}/dsl")
-async def get_layer_dsl(doc_id: str, layer_id: str, db: int = 0):
-    """Get layer data as DSL."""
-    store = get_doc_store(db)
-    doc = store.get(doc_id)
+def get_layer_dsl(
+    doc_id: str,
+    layer_id: str,
+    request: Request,
+    store: DocumentStore = Depends(get_doc_store),
+):
+    """Get layer data as DSL (ETag-tagged, so unchanged DSL can be revalidated with a 304)."""
+    doc, data = store.get_with_data(doc_id, layer_id)
     if not doc:
         raise HTTPException(status_code=404, detail="Document not found")
     
-    data = store.get_data(doc_id, layer_id)
     if data is None:
         raise HTTPException(status_code=404, detail=f"Layer {layer_id} not run yet")
     
     layer = get_layer(layer_id)
     dsl = layer.format_dsl(data)
     
-    return {"layer_id": layer_id, "ext": layer.ext, "dsl": dsl}
+    return etag_response(request, {"layer_id": layer_id, "ext": layer.ext, "dsl": dsl})
 
 
 @router.put("/{doc_id}/layers/{layer_id}")
-async def set_layer_override(doc_id: str, layer_id: str, req: SetLayerRequest, db: int = 0):
+def set_layer_override(
+    doc_id: str,
+    layer_id: str,
+    req: SetLayerRequest,
+    store: DocumentStore = Depends(get_doc_store),
+):
     """Set layer data from DSL (override)."""
-    store = get_doc_store(db)
     doc = store.get(doc_id)
     if not doc:
         raise HTTPException(status_code=404, detail="Document not found")
@@ -166,9 +226,12 @@ async def set_layer_override(doc_id: str, layer_id: str, req: SetLayerRequest, d
 
 
 @router.delete("/{doc_id}/layers/{layer_id}/override")
-async def clear_layer_override(doc_id: str, layer_id: str, db: int = 0):
+def clear_layer_override(
+    doc_id: str,
+    layer_id: str,
+    store: DocumentStore = Depends(get_doc_store),
+):
     """Clear layer data (will need re-run)."""
-    store = get_doc_store(db)
     doc = store.get(doc_id)
     if not doc:
         raise HTTPException(status_code=404, detail="Document not found")
@@ -2,10 +2,14 @@
 Knowledge Base routes: /api/kbs
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import Response
 from pydantic import BaseModel
 
+from world.core.kb import KBStore
 from world.server.deps import get_kb_store
+from world.server.cache import cached_body
+from world.server.responses import json_bytes
 
 
 router = APIRouter(prefix="/api/kbs", tags=["kbs"])
@@ -17,9 +21,13 @@ class CreateKBRequest(BaseModel):
 
 
 @router.get("")
-async def list_kbs(db: int = 0):
+def list_kbs(store: KBStore = Depends(get_kb_store)):
     """List all knowledge bases."""
-    store = get_kb_store(db)
+    body = cached_body(store.client, store.list_cache_key(), lambda: json_bytes(_kb_list(store)))
+    return Response(body, media_type="application/json")
+
+
+def _kb_list(store: KBStore) -> dict:
     kbs = store.list_all()
     return {
         "kbs": [
@@ -31,9 +39,8 @@ async def list_kbs(db: int = 0):
 
 
 @router.post("")
-async def create_kb(req: CreateKBRequest, db: int = 0):
+def create_kb(req: CreateKBRequest, store: KBStore = Depends(get_kb_store)):
     """Create a new knowledge base from DSL."""
-    store = get_kb_store(db)
     try:
         kb_id = store.create(req.name, req.dsl)
     except ValueError as e:
@@ -50,9 +57,8 @@ async def create_kb(req: CreateKBRequest, db: int = 0):
 
 
 @router.get("/{kb_id}")
-async def get_kb(kb_id: str, db: int = 0):
+def get_kb(kb_id: str, store: KBStore = Depends(get_kb_store)):
     """Get a knowledge base by ID."""
-    store = get_kb_store(db)
     kb = store.get(kb_id)
     if not kb:
         raise HTTPException(status_code=404, detail="Knowledge base not found")
@@ -60,9 +66,8 @@ async def get_kb(kb_id: str, db: int = 0):
 
 
 @router.get("/{kb_id}/dsl")
-async def get_kb_dsl(kb_id: str, db: int = 0):
+def get_kb_dsl(kb_id: str, store: KBStore = Depends(get_kb_store)):
     """Get knowledge base as DSL text."""
-    store = get_kb_store(db)
     kb = store.get(kb_id)
     if not kb:
         raise HTTPException(status_code=404, detail="Knowledge base not found")
@@ -70,8 +75,7 @@ async def get_kb_dsl(kb_id: str, db: int = 0):
 
 
 @router.delete("/{kb_id}")
-async def delete_kb(kb_id: str, db: int = 0):
+def delete_kb(kb_id: str, store: KBStore = Depends(get_kb_store)):
     """Delete a knowledge base."""
-    store = get_kb_store(db)
     store.delete(kb_id)
     return {"deleted": kb_id}
\ No newline at end of file
@@ -4,7 +4,7 @@ Layer routes: /api/layers
 
 from fastapi import APIRouter
 
-from world.core.layers import list_layers, get_layer
+from world.core.layers import layer_info
 
 
 router = APIRouter(prefix="/api/layers", tags=["layers"])
@@ -13,12 +13,4 @@ router = APIRouter(prefix="/api/layers", tags=["layers"])
 @router.get("")
 async def get_all_layers():
     """List all registered layers."""
-    layers = []
-    for lid in list_layers():
-        layer = get_layer(lid)
-        layers.append({
-            "id": lid,
-            "ext": layer.ext,
-            "depends_on": layer.depends_on,
-        })
-    return {"layers": layers}
\ No newline at end of file
+    return {"layers": layer_info()}
@@ -2,12 +2,17 @@
 Run routes: /api/runs
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from world.core.layers import list_layers, get_layer
+from world.core.layers import layer_ids, get_layer, dependency_levels
 from world.core.layers.runner import LayerRunner
-from world.server.deps import get_doc_store, get_run_store, get_kb_store, get_openai
+from world.core.document import DocumentStore
+from world.core.run import RunStore
+from world.core.kb import KBStore
+from world.server.deps import get_doc_store, get_run_store, get_kb_store, get_layer_runner
+from world.server.responses import json_bytes, etag_response
 
 
 router = APIRouter(prefix="/api/runs", tags=["runs"])
@@ -25,12 +30,13 @@ class ProcessRunRequest(BaseModel):
 
 
 @router.post("")
-async def create_run(req: CreateRunRequest, db: int = 0):
+def create_run(
+    req: CreateRunRequest,
+    doc_store: DocumentStore = Depends(get_doc_store),
+    run_store: RunStore = Depends(get_run_store),
+    kb_store: KBStore = Depends(get_kb_store),
+):
     """Create a new annotation run."""
-    doc_store = get_doc_store(db)
-    run_store = get_run_store(db)
-    kb_store = get_kb_store(db)
-    
     doc = doc_store.get(req.doc_id)
     if not doc:
         raise HTTPException(status_code=404, detail="Document not found")
@@ -51,12 +57,14 @@ async def create_run(req: CreateRunRequest, db: int = 0):
 
 
 @router.get("/{run_id}")
-async def get_run(run_id: str, db: int = 0):
-    """Get a run with all layer status."""
-    doc_store = get_doc_store(db)
-    run_store = get_run_store(db)
-    kb_store = get_kb_store(db)
-    
+def get_run(
+    run_id: str,
+    request: Request,
+    doc_store: DocumentStore = Depends(get_doc_store),
+    run_store: RunStore = Depends(get_run_store),
+    kb_store: KBStore = Depends(get_kb_store),
+):
+    """Get a run with all layer status (ETag-tagged, so an unchanged run can be revalidated with a 304)."""
     run = run_store.get(run_id)
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
@@ -64,29 +72,32 @@ async def get_run(run_id: str, db: int = 0):
     doc = doc_store.get(run.doc_id)
     kb = kb_store.get(run.kb_id)
     
-    layers = {}
-    for lid in list_layers():
-        data = run_store.get_data(run_id, lid)
-        layers[lid] = {
+    layer_data = run_store.get_many(run_id, layer_ids())
+    layers = {
+        lid: {
             "status": "done" if data else "pending",
             "data": data,
         }
+        for lid, data in layer_data.items()
+    }
     
-    return {
+    return etag_response(request, {
         **run.to_dict(),
         "doc_text": doc.text if doc else None,
         "kb_name": kb.name if kb else None,
         "layers": layers,
-    }
+    })
 
 
 @router.post("/{run_id}/process")
-async def process_run(run_id: str, req: ProcessRunRequest = None, db: int = 0):
+def process_run(
+    run_id: str,
+    req: ProcessRunRequest = None,
+    run_store: RunStore = Depends(get_run_store),
+    kb_store: KBStore = Depends(get_kb_store),
+    runner: LayerRunner = Depends(get_layer_runner),
+):
     """Process a run (execute layers)."""
-    doc_store = get_doc_store(db)
-    run_store = get_run_store(db)
-    kb_store = get_kb_store(db)
-    
     run = run_store.get(run_id)
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
@@ -95,16 +106,10 @@ async def process_run(run_id: str, req: ProcessRunRequest = None, db: int = 0):
     if not kb:
         raise HTTPException(status_code=404, detail="Knowledge base not found")
     
-    openai_client = get_openai()
-    runner = LayerRunner(doc_store, run_store, kb_store, {"openai": openai_client})
-    
-    if req and req.layers:
-        layer_ids = req.layers
-    else:
-        layer_ids = list_layers()
+    requested = req.layers if req and req.layers else layer_ids()
     
     force = req.force if req else False
-    results = runner.run(run_id, layer_ids, force=force)
+    results = runner.run(run_id, requested, force=force)
     
     return {
         "run_id": run_id,
@@ -115,22 +120,93 @@ async def process_run(run_id: str, req: ProcessRunRequest = None, db: int = 0):
     }
 
 
-@router.get("/{run_id}/layers/{layer_id}/dsl")
-async def get_run_layer_dsl(run_id: str, layer_id: str, db: int = 0):
-    """Get layer data as DSL text."""
-    doc_store = get_doc_store(db)
-    run_store = get_run_store(db)
-    kb_store = get_kb_store(db)
+@router.post("/{run_id}/process/stream")
+def process_run_stream(
+    run_id: str,
+    req: ProcessRunRequest = None,
+    run_store: RunStore = Depends(get_run_store),
+    kb_store: KBStore = Depends(get_kb_store),
+    runner: LayerRunner = Depends(get_layer_runner),
+):
+    """Process a run, sending each layer's result as a server-sent event when it finishes."""
+    run = run_store.get(run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Run not found")
     
-    runner = LayerRunner(doc_store, run_store, kb_store, {})
+    kb = kb_store.get(run.kb_id)
+    if not kb:
+        raise HTTPException(status_code=404, detail="Knowledge base not found")
+    
+    requested = req.layers if req and req.layers else layer_ids()
+    
+    # Resolve layers before the 200 and its headers go out, so an unknown
+    # layer or a dependency cycle is a 400 rather than a cut-off stream
+    try:
+        dependency_levels(requested)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    force = req.force if req else False
+    results = runner.run_iter(run_id, requested, force=force)
+    
+    return StreamingResponse(_layer_events(results), media_type="text/event-stream")
+
+
+def _layer_events(results):
+    """One data event per finished layer; an error event if processing fails part way."""
+    try:
+        for lid, r in results:
+            event = {"layer_id": lid, "success": r.success, "message": r.message}
+            yield b"data: " + json_bytes(event) + b"\n\n"
+    except Exception as e:
+        yield b"event: error\ndata: " + json_bytes({"detail": str(e)}) + b"\n\n"
+
+
+@router.get("/{run_id}/dsl")
+def get_run_dsls(
+    run_id: str,
+    ids: str | None = None,
+    run_store: RunStore = Depends(get_run_store),
+    runner: LayerRunner = Depends(get_layer_runner),
+):
+    """Get several layers as DSL text in one response (comma-separated ids; default: every layer)."""
+    if not run_store.get(run_id):
+        raise HTTPException(status_code=404, detail="Run not found")
+    
+    known = layer_ids()
+    requested = ids.split(",") if ids else known
+    unknown = [lid for lid in requested if lid not in known]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown layers: {unknown}. Available: {', '.join(known)}")
+    
+    dsls = runner.get_dsl_many(run_id, requested)
+    layers = {}
+    for lid, dsl in dsls.items():
+        if dsl is None:
+            layers[lid] = None
+        elif isinstance(dsl, Exception):
+            layers[lid] = {"ext": get_layer(lid).ext, "dsl": None, "error": str(dsl)}
+        else:
+            layers[lid] = {"ext": get_layer(lid).ext, "dsl": dsl}
+    return {"run_id": run_id, "layers": layers}
+
+
+@router.get("/{run_id}/layers/{layer_id}/dsl")
+def get_run_layer_dsl(
+    run_id: str,
+    layer_id: str,
+    request: Request,
+    runner: LayerRunner = Depends(get_layer_runner),
+):
+    """Get layer data as DSL text (ETag-tagged, so unchanged DSL can be revalidated with a 304)."""
     dsl = runner.get_dsl(run_id, layer_id)
     
     if dsl is None:
         raise HTTPException(status_code=404, detail=f"No data for layer '{layer_id}'")
     
     layer = get_layer(layer_id)
-    return {
+    return etag_response(request, {
         "layer_id": layer_id,
         "ext": layer.ext,
         "dsl": dsl,
-    }
\ No newline at end of file
+    })
@@ -74,6 +74,39 @@ class TestDocs:
     def test_doc_not_found(self, client):
         r = client.get("/docs/nonexistent123")
         assert r.status_code == 404
+    
+    def test_get_all_layers(self, client):
+        r = client.post("/docs", json={"text": "Socrates is wise"})
+        doc_id = r.json()["id"]
+        
+        # Nothing computed yet
+        r = client.get(f"/docs/{doc_id}/layers")
+        assert r.status_code == 200
+        assert r.json()["layers"] == {}
+        
+        # Set one layer, then ask for it and a missing one
+        dsl = "# sentence 0\n0: Socrates\n1: is\n2: wise\n"
+        r = client.put(f"/docs/{doc_id}/layers/base", json={"dsl": dsl})
+        assert r.json()["success"]
+        
+        r = client.get(f"/docs/{doc_id}/layers", params={"ids": "base,clauses"})
+        layers = r.json()["layers"]
+        assert layers["base"]["sentences"][0]["tokens"][2]["text"] == "wise"
+        assert layers["clauses"] is None
+    
+    def test_run_layers(self, client):
+        r = client.post("/docs", json={"text": "Socrates is wise"})
+        doc_id = r.json()["id"]
+        
+        dsl = "# sentence 0\n0: Socrates\n1: is\n2: wise\n"
+        client.put(f"/docs/{doc_id}/layers/base", json={"dsl": dsl})
+        
+        r = client.post(f"/docs/{doc_id}/layers/run", json={"layers": ["base"]})
+        assert r.status_code == 200
+        results = r.json()["results"]
+        assert [res["layer_id"] for res in results] == ["base"]
+        assert results[0]["success"]
+        assert results[0]["message"] == "cached"
 
 
 class TestRuns:
@@ -99,6 +132,16 @@ rule [x:person]: man(theme: x) -> mortal(theme: x)
         assert run["doc_id"] == doc_id
         assert run["kb_id"] == kb_id
     
+    def test_get_run_not_modified(self, client, doc_id, kb_id):
+        r = client.post("/runs", json={"doc_id": doc_id, "kb_id": kb_id})
+        run_id = r.json()["id"]
+        
+        r = client.get(f"/runs/{run_id}")
+        etag = r.headers["etag"]
+        
+        r = client.get(f"/runs/{run_id}", headers={"If-None-Match": etag})
+        assert r.status_code == 304
+    
     def test_process_run(self, client, doc_id, kb_id):
         # Create run
         r = client.post("/runs", json={"doc_id": doc_id, "kb_id": kb_id})
@@ -119,6 +162,24 @@ rule [x:person]: man(theme: x) -> mortal(theme: x)
         assert results["logic"]["success"]
         assert results["ground"]["success"]
     
+    def test_process_run_stream_unknown_layer(self, client, doc_id, kb_id):
+        r = client.post("/runs", json={"doc_id": doc_id, "kb_id": kb_id})
+        run_id = r.json()["id"]
+        
+        # Rejected before the stream starts, not cut off part way
+        r = client.post(f"/runs/{run_id}/process/stream", json={"layers": ["nope"]})
+        assert r.status_code == 400
+    
+    def test_get_run_dsls_validates(self, client, doc_id, kb_id):
+        r = client.post("/runs", json={"doc_id": doc_id, "kb_id": kb_id})
+        run_id = r.json()["id"]
+        
+        r = client.get(f"/runs/{run_id}/dsl", params={"ids": "args,"})
+        assert r.status_code == 400
+        
+        r = client.get("/runs/nonexistent123/dsl")
+        assert r.status_code == 404
+    
     def test_get_run_layer_dsl(self, client, doc_id, kb_id):
         # Create and process
         r = client.post("/runs", json={"doc_id": doc_id, "kb_id": kb_id})
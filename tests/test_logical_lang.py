@@ -0,0 +1,76 @@
+# tests/test_logical_lang.py
+"""Tests for the .logic DSL parser."""
+
+import pytest
+
+from world.core.logic import Type, RoleLabel, Entity, Constant, Variable, Predicate
+from world.core.logical_lang import (
+    LogicalParser, ParseError, parse_logical, format_document,
+)
+
+
+KB = """
+entity socrates : person
+entity plato : person
+man(theme: socrates)
+man(theme: plato)
+rule [x:person]: man(theme: x) -> mortal(theme: x)
+rule [x:person, y:person]: likes(agent: x, theme: y) & man(theme: y) -> friends(agent: x, theme: y) [0.8]
+? mortal(theme: socrates)
+"""
+
+
+def test_parse_entities():
+    doc = parse_logical(KB)
+    person = Type("person")
+    assert doc.entities["socrates"] == Constant(Entity("socrates"), person)
+    assert set(doc.types) == {"person"}
+
+
+def test_parse_rule():
+    doc = parse_logical(KB)
+    rule = doc.rules[1]
+    x = Variable(Type("person"), "x")
+    y = Variable(Type("person"), "y")
+
+    assert rule.variables == [x, y]
+    assert rule.weight == 0.8
+    assert [p.function_name for p in rule.premises] == ["likes", "man"]
+    assert rule.conclusion == Predicate("friends", (
+        (RoleLabel("agent"), x),
+        (RoleLabel("theme"), y),
+    ))
+
+
+def test_roles_and_predicates_are_shared():
+    doc = parse_logical(KB)
+    man_socrates = doc.propositions[0]
+    man_plato = doc.propositions[1]
+
+    # Same role name -> same RoleLabel object
+    assert man_socrates.roles[0][0] is man_plato.roles[0][0]
+
+    # Same predicate parsed twice -> same Predicate object
+    parser = LogicalParser()
+    parser.parse(KB)
+    again = parser.parse_predicate("man(theme: socrates)")
+    assert again is parser.doc.propositions[0]
+
+
+def test_unknown_entity():
+    with pytest.raises(ParseError, match="Unknown entity"):
+        parse_logical("man(theme: nobody)")
+
+
+def test_round_trip():
+    doc = parse_logical(KB)
+    again = parse_logical(format_document(doc))
+    assert again.propositions == doc.propositions
+    assert again.rules == doc.rules
+    assert again.queries == doc.queries
+
+
+def test_tabs_and_crlf():
+    text = KB.replace("\n", "\r\n").replace("entity socrates :", "entity\tsocrates\t:")
+    doc = parse_logical(text)
+    assert doc.propositions == parse_logical(KB).propositions
@@ -0,0 +1,85 @@
+# tests/test_sentence_lang.py
+"""Tests for the sentence structure DSL."""
+
+import re
+
+import pytest
+
+from world.core.sentence_lang import parse_sentence, validate_sentence_doc, SentenceParseError
+
+
+MORTAL = """
+tokens: If someone is a man then they are mortal
+
+clause [1:5] antecedent:
+  verb: is [2]
+  agent: someone [1:2]
+  theme: a man [3:5]
+
+clause [6:9] consequent:
+  verb: are [7]
+  agent: they [6:7]
+  theme: mortal [8:9]
+
+skip: 0 5
+coref: 1 6
+"""
+
+
+def test_parse_sentence():
+    doc = parse_sentence(MORTAL)
+
+    assert len(doc.tokens) == 9
+    assert [c.label for c in doc.clauses] == ["antecedent", "consequent"]
+    assert doc.clauses[0].arguments[1].text == "a man"
+    assert doc.skip_indices == [0, 5]
+    assert doc.coreferences[0].index_b == 6
+
+
+def test_validate_ok():
+    doc = parse_sentence(MORTAL)
+    assert validate_sentence_doc(doc) == []
+
+
+def test_validate_uncovered_tokens():
+    doc = parse_sentence(MORTAL.replace("skip: 0 5", "skip: 0"))
+    assert validate_sentence_doc(doc) == ["Uncovered tokens: [(5, 'then')]"]
+
+
+def test_validate_out_of_range_indices():
+    doc = parse_sentence(MORTAL)
+    doc.skip_indices.append(42)
+    doc.clauses[1].arguments[1].end = 12
+
+    errors = validate_sentence_doc(doc)
+
+    assert errors == ["Arg theme [8:12] not in clause [6:9]"]
+
+
+def test_validate_missing_verb_does_not_cover_last_token():
+    doc = parse_sentence(MORTAL)
+    doc.clauses[1].verb_index = -1
+    doc.clauses[1].arguments.pop()
+
+    errors = validate_sentence_doc(doc)
+
+    assert "Verb index -1 not in clause [6:9]" in errors
+    assert "Uncovered tokens: [(7, 'are'), (8, 'mortal')]" in errors
+
+
+def test_parse_tabs_and_crlf():
+    text = MORTAL.replace("\n", "\r\n").replace("  verb:", "\tverb:")
+    doc = parse_sentence(text)
+    assert doc == parse_sentence(MORTAL)
+
+
+@pytest.mark.parametrize("text, message", [
+    ("verb: is [2]", "verb: must be inside a clause"),
+    ("clause [1:5] a:\n  verb: is [2:3]", "Expected: verb: word [index]"),
+    ("clause [x] a:", "Expected: clause [start:end] label:"),
+    ("clause [1:5] a:\n  agent: someone", "Expected: role: span [start:end]"),
+    ("someone is a man", "Unknown syntax"),
+])
+def test_parse_errors(text, message):
+    with pytest.raises(SentenceParseError, match=re.escape(message)):
+        parse_sentence(text)
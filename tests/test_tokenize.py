@@ -47,6 +47,37 @@ def test_tokenize_empty():
     assert tokens == []
 
 
+def test_spell_correct_known_words_skip_llm():
+    # No client is ever used: every token is punctuation, a number or a known word
+    corrector = SpellCorrector(openai_client=object(), known_words=["hello", "World"])
+    corrected = corrector.correct(tokenize("Hello, world 42!"))
+    
+    assert [c.corrected for c in corrected] == ["Hello", ",", "world", "42", "!"]
+
+
+def test_corrector_keeps_verdicts_when_memory_is_full(monkeypatch):
+    # Filling the verdict memory mid-call must not drop this call's corrections
+    import world.core.tokenize as tokenize_module
+    monkeypatch.setattr(tokenize_module, "MAX_REMEMBERED_WORDS", 2)
+    
+    class Reply:
+        def __init__(self, content):
+            self.choices = [type("Choice", (), {"message": type("Message", (), {"content": content})})]
+    
+    class Client:
+        def __init__(self):
+            self.chat = type("Chat", (), {"completions": self})
+        
+        def create(self, **kwargs):
+            return Reply('{"corrections": {"wentt": "went", "teh": "the"}}')
+    
+    corrector = SpellCorrector(openai_client=Client())
+    corrected = corrector.correct(tokenize("I wentt to teh bank2"))
+    
+    assert [c.corrected for c in corrected] == ["I", "went", "to", "the", "bank2"]
+    assert "bank2" in corrector._verdicts
+
+
 # === Spell correction tests (requires OpenAI) ===
 
 @pytest.mark.skipif(
@@ -94,3 +125,23 @@ def test_spell_correct_empty():
     corrector = SpellCorrector()
     corrected = corrector.correct([])
     assert corrected == []
+
+
+@pytest.mark.skipif(
+    not pytest.importorskip("openai"),
+    reason="OpenAI not available"
+)
+def test_spell_correct_batch():
+    corrector = SpellCorrector()
+    batches = [
+        [Token("I", 0), Token("wentt", 2), Token("home", 8)],
+        [],
+        [Token("teh", 0), Token("dog", 4)],
+    ]
+    
+    corrected = corrector.correct_batch(batches)
+    
+    assert [len(c) for c in corrected] == [3, 0, 2]
+    assert corrected[0][1].corrected == "went"
+    assert corrected[2][0].original == "teh"
+    assert corrected[2][0].corrected == "the"